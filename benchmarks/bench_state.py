@@ -0,0 +1,59 @@
+"""
+Micro-benchmark: WordleState clone/play throughput.
+
+Compares the previous deepcopy-based clone with the structural-sharing
+clone and the allocation-free play_into path.
+
+    python -m benchmarks.bench_state
+"""
+import copy
+import random
+import timeit
+
+from utils import load_wordlist
+from wordle import WordleState
+
+
+def deepcopy_clone(state):
+    """
+    Previous WordleState.clone(): deep copy of every field but the word data
+    (table and word list shared). Spelled out field by field because
+    copy.deepcopy now goes through __getstate__, which drops the binding.
+    """
+    clone = WordleState.__new__(WordleState)
+    clone.secret = state.secret
+    clone.max_attempts = state.max_attempts
+    clone.history = copy.deepcopy(state.history)
+    clone.table = state.table
+    clone.candidates = copy.deepcopy(state.candidates)
+    clone._wordlist = state._wordlist
+    clone._moves = copy.deepcopy(state._moves)
+    return clone
+
+
+def run(n=20000, seed=0):
+    wordlist = load_wordlist("wordlist.txt")
+    rng = random.Random(seed)
+    state = WordleState(rng.choice(wordlist))
+    state.legal_moves(wordlist)
+    state.play(rng.choice(wordlist))
+    moves = state.legal_moves(wordlist)
+    scratch = state.clone()
+
+    cases = {
+        "clone (deepcopy, before)": lambda: deepcopy_clone(state),
+        "clone (shared, after)": lambda: state.clone(),
+        "clone+play (deepcopy, before)": lambda: deepcopy_clone(state).play(rng.choice(moves)),
+        "clone+play (shared, after)": lambda: state.clone().play(rng.choice(moves)),
+        "play_into scratch (after)": lambda: state.play_into(rng.choice(moves), scratch),
+    }
+    results = {}
+    for name, fn in cases.items():
+        elapsed = timeit.timeit(fn, number=n)
+        results[name] = n / elapsed
+        print(f"{name:<32} {results[name]:>12,.0f} ops/s")
+    return results
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,283 @@
+"""
+Benchmark suite: feedback, filtering, cloning, playouts and solvers.
+
+Every case runs at fixed seeds on word lists of fixed sizes (sampled
+deterministically from wordlist.txt) and reports ops/sec and latency
+percentiles. Results can be saved as a JSON baseline, and later runs
+compared against it: any case whose throughput drops by more than
+'threshold' is a regression (exit status 1).
+
+    python -m benchmarks.suite --save benchmarks/baseline.json
+    python -m benchmarks.suite --compare benchmarks/baseline.json
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import time
+from functools import partial
+
+import numpy as np
+
+from feedback import WordList
+from playouts import (
+    random_playout,
+    batch_random_playout,
+    entropy_playout,
+    frequency_playout,
+    entropy_plus_playout,
+    frequency_plus_playout,
+)
+from solvers import (
+    random_solver,
+    flat_mc,
+    uct_search,
+    uct_rave_search,
+    uct_grave_search,
+    nested_mc_search,
+)
+from utils import derive_seed, seed_all
+from wordle import WordleState
+
+
+BASELINE_VERSION = 1
+DEFAULT_SIZES = (500, 2314)
+DEFAULT_THRESHOLD = 0.25
+
+PLAYOUTS = {
+    "random_playout": random_playout,
+    "batch_random_playout(k=16)": partial(batch_random_playout, k=16),
+    "entropy_playout": entropy_playout,
+    "frequency_playout": frequency_playout,
+    "entropy_plus_playout": entropy_plus_playout,
+    "frequency_plus_playout": frequency_plus_playout,
+}
+
+# Fixed per-move budgets, small enough to keep a full run in minutes
+SOLVERS = {
+    "random_solver": random_solver,
+    "flat_mc(n_playouts=5)": partial(flat_mc, n_playouts=5),
+    "uct_search(n_iter=100)": partial(uct_search, n_iter=100),
+    "uct_rave_search(n_iter=100)": partial(uct_rave_search, n_iter=100),
+    "uct_grave_search(n_iter=100)": partial(uct_grave_search, n_iter=100),
+    "nested_mc_search(level=1)": partial(nested_mc_search, level=1),
+}
+
+
+# ===============================
+#  Fixtures
+# ===============================
+def sample_wordlist(size, path="wordlist.txt", seed=0):
+    """Deterministic sample of 'size' words (sorted) of the word list at 'path'."""
+    with open(path, "r", encoding="utf-8") as f:
+        words = sorted({w.strip().lower() for w in f if len(w.strip()) == 5})
+    if size < len(words):
+        words = sorted(random.Random(seed).sample(words, size))
+    return WordList(words)
+
+
+def positions(wordlist, n, seed=0):
+    """
+    n bound mid-game states (one fixed opening guess played), the typical
+    input of solvers and playouts after the first move.
+    """
+    rng = random.Random(seed)
+    opener = wordlist[rng.randrange(len(wordlist))]
+    states = []
+    for secret in rng.sample(list(wordlist), min(n, len(wordlist))):
+        state = WordleState(secret)
+        state.legal_moves(wordlist)
+        state.play(opener)
+        state.legal_moves(wordlist)
+        states.append(state)
+    return states
+
+
+# ===============================
+#  Measurement
+# ===============================
+def _stats(latencies, total_ops, total_seconds):
+    ms = np.asarray(latencies) * 1000.0
+    return {
+        "ops_per_sec": total_ops / total_seconds if total_seconds > 0 else float("inf"),
+        "p50_ms": float(np.percentile(ms, 50)),
+        "p95_ms": float(np.percentile(ms, 95)),
+        "p99_ms": float(np.percentile(ms, 99)),
+        "samples": len(ms),
+    }
+
+
+def time_batched(fn, number, repeat, ops_per_call=1):
+    """
+    Micro-operation: 'repeat' rounds of 'number' calls, each call doing
+    ops_per_call operations; latency = round time / operations.
+    """
+    fn()
+    ops = number * ops_per_call
+    latencies, total = [], 0.0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        elapsed = time.perf_counter() - start
+        latencies.append(elapsed / ops)
+        total += elapsed
+    return _stats(latencies, ops * repeat, total)
+
+
+def time_calls(fn, inputs, seed=0):
+    """One timed call per input, RNGs seeded per call (per-move latency)."""
+    fn(inputs[0])
+    latencies = []
+    for i, item in enumerate(inputs):
+        seed_all(derive_seed(seed, i))
+        start = time.perf_counter()
+        fn(item)
+        latencies.append(time.perf_counter() - start)
+    return _stats(latencies, len(latencies), sum(latencies))
+
+
+# ===============================
+#  Cases
+# ===============================
+def cases(wordlist, quick=False, seed=0):
+    """{name: thunk returning the measured stats} for one word list."""
+    n_states = 5 if quick else 20
+    number, repeat = (200, 5) if quick else (2000, 20)
+    states = positions(wordlist, n_states, seed)
+    state = states[0]
+    rng = random.Random(seed)
+    pairs = [(rng.choice(wordlist), rng.choice(wordlist)) for _ in range(number)]
+    moves = state.legal_moves(wordlist)
+
+    def feedback():
+        for guess, _ in pairs:
+            state.feedback(guess)
+
+    def feedback_sim():
+        for guess, candidate in pairs:
+            state.feedback_sim(candidate, guess)
+
+    def legal_moves_bind():
+        fresh = WordleState(state.secret)
+        fresh.history = state.history
+        fresh.legal_moves(wordlist)
+
+    def legal_moves_play():
+        child = state.clone()
+        child.play(moves[0])
+        child.legal_moves(wordlist)
+
+    run = {
+        "feedback": lambda: time_batched(feedback, 1, repeat, ops_per_call=number),
+        "feedback_sim": lambda: time_batched(feedback_sim, 1, repeat, ops_per_call=number),
+        "legal_moves (bind)": lambda: time_batched(legal_moves_bind, number // 10, repeat),
+        "legal_moves (after play)": lambda: time_batched(legal_moves_play, number, repeat),
+        "clone": lambda: time_batched(state.clone, number * 10, repeat),
+    }
+    for name, playout in PLAYOUTS.items():
+        run[f"playout {name}"] = partial(time_calls, lambda s, p=playout: p(s, wordlist),
+                                         states * (1 if quick else 5), seed)
+    for name, solver in SOLVERS.items():
+        run[f"solver {name}"] = partial(time_calls, lambda s, f=solver: f(s, wordlist),
+                                        states, seed)
+    return run
+
+
+def run_suite(sizes=DEFAULT_SIZES, quick=False, seed=0, only=None, path="wordlist.txt"):
+    """Run every case (or those whose name contains 'only') for each word-list size."""
+    results = {}
+    for size in sizes:
+        wordlist = sample_wordlist(size, path, seed)
+        for name, thunk in cases(wordlist, quick, seed).items():
+            if only and only not in name:
+                continue
+            stats = thunk()
+            key = f"{name} [n={len(wordlist)}]"
+            results[key] = stats
+            print(f"{key:<48} {stats['ops_per_sec']:>14,.1f} ops/s   "
+                  f"p50 {stats['p50_ms']:9.4f} ms   p95 {stats['p95_ms']:9.4f} ms", flush=True)
+    return results
+
+
+# ===============================
+#  Baseline
+# ===============================
+def save_baseline(results, path, seed=0, quick=False):
+    data = {
+        "version": BASELINE_VERSION,
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "machine": platform.machine(),
+        "seed": seed,
+        "quick": quick,
+        "results": results,
+    }
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, sort_keys=True)
+    os.replace(tmp, path)
+
+
+def load_baseline(path):
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    if data.get("version") != BASELINE_VERSION:
+        raise ValueError(f"Unsupported baseline version in {path}")
+    return data["results"]
+
+
+def compare(results, baseline, threshold=DEFAULT_THRESHOLD):
+    """
+    Regressions of 'results' against 'baseline': cases present in both whose
+    ops/sec dropped by more than 'threshold' (a fraction).
+    Returns [(name, baseline ops/sec, current ops/sec, relative change)].
+    """
+    regressions = []
+    for name, stats in results.items():
+        base = baseline.get(name)
+        if base is None:
+            continue
+        change = stats["ops_per_sec"] / base["ops_per_sec"] - 1.0
+        if change < -threshold:
+            regressions.append((name, base["ops_per_sec"], stats["ops_per_sec"], change))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES))
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--quick", action="store_true", help="fewer repetitions")
+    parser.add_argument("--only", help="run only cases whose name contains this")
+    parser.add_argument("--save", metavar="PATH", help="write the results as a JSON baseline")
+    parser.add_argument("--compare", metavar="PATH", help="fail on regressions against this baseline")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="allowed ops/sec drop, as a fraction (default 0.25)")
+    args = parser.parse_args(argv)
+
+    results = run_suite(args.sizes, args.quick, args.seed, args.only)
+
+    status = 0
+    if args.compare:
+        if not os.path.exists(args.compare):
+            print(f"\nNo baseline at {args.compare}: nothing to compare.")
+        else:
+            regressions = compare(results, load_baseline(args.compare), args.threshold)
+            for name, before, after, change in regressions:
+                print(f"REGRESSION {name}: {before:,.1f} -> {after:,.1f} ops/s ({change:+.1%})")
+            if regressions:
+                status = 1
+            else:
+                print(f"\nNo regression beyond {args.threshold:.0%} against {args.compare}.")
+    if args.save:
+        save_baseline(results, args.save, args.seed, args.quick)
+        print(f"Baseline saved to {args.save}")
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
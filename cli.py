@@ -0,0 +1,250 @@
+"""
+Command-line entry point.
+
+    python cli.py solve --solver uct --history crane:BYBGB
+    python cli.py solve --solver entropy --secret grape
+    python cli.py evaluate --solver uct --games 100 --workers 4 --seed 0
+    python cli.py compare --games 50 --seed 0 --store games.jsonl
+    python cli.py plot --store games.jsonl
+    python cli.py sweep --search uct_rave --param c=0.7,1.41 --param rave_k=100,300,1000
+    python cli.py bench --quick
+
+Only argparse is imported at startup: each subcommand imports what it
+needs, so solve/evaluate never load matplotlib or pandas.
+"""
+import argparse
+import random
+import sys
+
+
+def _wordlist(args):
+    from utils import load_wordlist
+    if args.limit is not None and args.seed is not None:
+        random.seed(args.seed)  # same subset on every run (resumable stores)
+    return load_wordlist(args.wordlist, limit=args.limit)
+
+
+def _solver(args, wordlist):
+    from solvers import SOLVERS
+    if args.solver not in SOLVERS:
+        raise SystemExit(f"unknown solver {args.solver!r} (choose from {', '.join(SOLVERS)})")
+    solver = SOLVERS[args.solver]
+    if args.book:
+        from opening_book import with_opening_book
+        solver = with_opening_book(solver, wordlist)
+    return solver
+
+
+# ===============================
+#  Subcommands
+# ===============================
+def cmd_solve(args):
+    """Next guess after --history, or a full game against --secret."""
+    from utils import seed_all
+
+    wordlist = _wordlist(args)
+    solver = _solver(args, wordlist)
+    seed_all(args.seed)
+    if args.secret:
+        from experiments import play_game
+        state = play_game(args.secret, solver, wordlist)
+        for guess, feedback in state.attempts:
+            print(guess, feedback)
+        print("win" if state.is_won() else "loss", len(state.history))
+        return 0
+
+    from wordle import parse_history, state_from_history
+
+    try:
+        history = parse_history(item.split(":", 1) for item in args.history)
+        state = state_from_history(wordlist, history, args.seed)
+    except ValueError as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 1
+    print(solver(state, wordlist))
+    return 0
+
+
+def cmd_evaluate(args):
+    wordlist = _wordlist(args)
+    solver = _solver(args, wordlist)
+    if args.exhaustive:
+        from experiments import evaluate_exhaustive
+        stats = evaluate_exhaustive(solver, wordlist, seed=args.seed or 0)
+    elif args.adaptive:
+        from experiments import evaluate_adaptive
+        result = evaluate_adaptive({args.solver: solver}, wordlist, max_games=args.games,
+                                   n_workers=args.workers, seed=args.seed or 0, **_adaptive(args))
+        stats = result["solvers"][args.solver]
+        lo, hi = stats["win_rate_ci"]
+        print(f"stopped ({stats['stopped']}): win rate in [{lo:.3f}, {hi:.3f}], "
+              "avg guesses in [{:.3f}, {:.3f}]".format(*stats["avg_guesses_ci"]))
+    else:
+        from experiments import evaluate
+        stats = evaluate(solver, wordlist, n_games=args.games, n_workers=args.workers,
+                         seed=args.seed)
+    print(f"games: {stats['n_games']}  win rate: {stats['win_rate']:.3f}  "
+          f"avg guesses (wins): {stats['avg_guesses']:.3f}")
+    return 0
+
+
+def _adaptive(args):
+    return {"win_width": args.win_width, "guesses_width": args.guesses_width,
+            "batch_size": args.batch_size}
+
+
+def cmd_compare(args):
+    from experiments import run_comparisons
+
+    wordlist = _wordlist(args)
+    run_comparisons(wordlist, n_games=args.games, save_path=args.save, n_workers=args.workers,
+                    seed=args.seed, use_book=args.book, store=args.store,
+                    adaptive=_adaptive(args) if args.adaptive else None)
+    return 0
+
+
+def cmd_plot(args):
+    import os
+    import pandas as pd
+    from plots import plot_avg_guesses, plot_cdf, plot_histogram, plot_winrates
+
+    if args.store:
+        from results_store import ResultStore
+        df = df_dist = ResultStore(args.store)
+        names = list(df.summary())
+    else:
+        df = pd.read_csv(args.results)
+        df_dist = pd.read_csv(args.distribution) if args.distribution else None
+        names = list(df_dist["Solver"].unique()) if df_dist is not None else []
+    out = args.out_dir
+    plot_winrates(df, save_path=os.path.join(out, "plot_winrate.png"))
+    plot_avg_guesses(df, save_path=os.path.join(out, "plot_avg_guesses.png"))
+    if df_dist is not None:
+        solvers = args.solvers or names
+        plot_histogram(df_dist, solvers, save_path=os.path.join(out, "plot_histogram.png"))
+        plot_cdf(df_dist, solvers, save_path=os.path.join(out, "plot_cdf.png"))
+    return 0
+
+
+def _value(text):
+    """Sweep value: int, float, playout function name, or string."""
+    for cast in (int, float):
+        try:
+            return cast(text)
+        except ValueError:
+            pass
+    import playouts
+    return getattr(playouts, text, text)
+
+
+def cmd_sweep(args):
+    import solvers
+    from sweep import format_table, grid, make_solver, sample_space, successive_halving
+
+    search = {"flat_mc": solvers.flat_mc, "uct": solvers.uct_search, "uct_rave": solvers.uct_rave_search,
+              "uct_grave": solvers.uct_grave_search, "nmcs": solvers.nested_mc_search}[args.search]
+    space = {}
+    for item in args.param:
+        name, _, values = item.partition("=")
+        space[name] = [_value(v) for v in values.split(",")]
+    configs = sample_space(space, args.random, args.seed or 0) if args.random else grid(space)
+    try:
+        for config in configs:
+            make_solver(search, config)
+    except ValueError as e:
+        raise SystemExit(f"error: {e}")
+
+    wordlist = _wordlist(args)
+    rows = successive_halving(search, configs, wordlist, min_games=args.min_games,
+                              max_games=args.max_games, eta=args.eta, seed=args.seed or 0,
+                              n_workers=args.workers, store=args.store)
+    print(format_table(rows))
+    return 0
+
+
+# ===============================
+#  Parser
+# ===============================
+def build_parser():
+    parser = argparse.ArgumentParser(prog="wordle", description="Wordle MCTS solver")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    def add_common(p, solver=True):
+        p.add_argument("--wordlist", default="wordlist.txt")
+        p.add_argument("--limit", type=int, help="random subset of the word list")
+        p.add_argument("--seed", type=int, default=None)
+        p.add_argument("--book", action="store_true", help="play the opening book first")
+        if solver:
+            p.add_argument("--solver", default="uct", help="name in solvers.SOLVERS")
+
+    def add_adaptive(p):
+        p.add_argument("--adaptive", action="store_true",
+                       help="play batches until the confidence intervals are narrow enough "
+                            "(--games is then the maximum)")
+        p.add_argument("--win-width", type=float, default=0.1)
+        p.add_argument("--guesses-width", type=float, default=0.25)
+        p.add_argument("--batch-size", type=int, default=20)
+
+    p = sub.add_parser("solve", help="next guess for a history (or play one game)")
+    add_common(p)
+    p.add_argument("--history", nargs="*", default=[], metavar="GUESS:FEEDBACK",
+                   help="e.g. crane:BYBGB stone:BBGGB")
+    p.add_argument("--secret", help="play a full game against this word")
+    p.set_defaults(func=cmd_solve, seed=0)
+
+    p = sub.add_parser("evaluate", help="evaluate one solver")
+    add_common(p)
+    p.add_argument("--games", type=int, default=50)
+    p.add_argument("--workers", type=int, default=1)
+    p.add_argument("--exhaustive", action="store_true", help="every secret of the word list")
+    add_adaptive(p)
+    p.set_defaults(func=cmd_evaluate)
+
+    p = sub.add_parser("compare", help="compare the solvers of experiments.run_comparisons")
+    add_common(p, solver=False)
+    p.add_argument("--games", type=int, default=50)
+    p.add_argument("--workers", type=int, default=1)
+    p.add_argument("--save", default="results.csv")
+    p.add_argument("--store", help="JSONL file receiving every game; rerun with the same seed to resume")
+    add_adaptive(p)
+    p.set_defaults(func=cmd_compare)
+
+    p = sub.add_parser("plot", help="figures from result CSV files")
+    p.add_argument("--results", default="results.csv")
+    p.add_argument("--distribution", help="CSV with Solver, Guesses, Count columns")
+    p.add_argument("--store", help="JSONL game store (instead of the CSV files)")
+    p.add_argument("--solvers", nargs="*", help="solvers of the histogram/CDF (default: all)")
+    p.add_argument("--out-dir", default=".")
+    p.set_defaults(func=cmd_plot)
+
+    p = sub.add_parser("sweep", help="hyperparameter sweep with successive halving")
+    add_common(p, solver=False)
+    p.add_argument("--search", default="uct", choices=["flat_mc", "uct", "uct_rave", "uct_grave", "nmcs"])
+    p.add_argument("--param", action="append", default=[], metavar="NAME=V1,V2,...",
+                   help="e.g. c=0.7,1.41 rave_k=100,300 playout_fn=entropy_plus_playout "
+                        "playout_fn.alpha=0.5,0.7")
+    p.add_argument("--random", type=int, metavar="N", help="N random configurations instead of the grid")
+    p.add_argument("--min-games", type=int, default=10)
+    p.add_argument("--max-games", type=int)
+    p.add_argument("--eta", type=int, default=3)
+    p.add_argument("--workers", type=int, default=1)
+    p.add_argument("--store", help="JSONL cache of played games (reruns skip them)")
+    p.set_defaults(func=cmd_sweep)
+
+    # Listed for --help only: main() hands "bench ..." to benchmarks.suite
+    sub.add_parser("bench", help="benchmark suite (arguments of benchmarks.suite)")
+    return parser
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else list(argv)
+    if argv[:1] == ["bench"]:
+        # The suite parses its own options (argparse.REMAINDER misses leading ones)
+        from benchmarks.suite import main as bench_main
+        return bench_main(argv[1:])
+    args = build_parser().parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,105 @@
+from functools import lru_cache
+
+import numpy as np
+
+from feedback import ALL_GREEN
+from playouts import random_playout
+from utils import solver_key
+from wordle import WordleState
+
+
+# Candidate sets up to this size are solved exactly
+ENDGAME_THRESHOLD = 20
+
+
+# ===============================
+#  Exact expectimax
+# ===============================
+def solve(table, candidates, attempts_left):
+    """
+    Exact value of a position where the secret is uniform over 'candidates'
+    (table indices) and guesses are candidates (the repo's legal moves).
+    Returns (win probability, expected number of guesses, best guess index):
+    the win probability is maximized, ties broken on fewer guesses.
+    """
+    candidates = np.ascontiguousarray(candidates, dtype=np.int64)
+    return _solve(table, candidates.tobytes(), attempts_left)
+
+
+@lru_cache(maxsize=200_000)
+def _solve(table, key, attempts_left):
+    # key: canonical candidate-set key (bytes of the sorted index array)
+    candidates = np.frombuffer(key, dtype=np.int64)
+    n = len(candidates)
+    if attempts_left <= 0 or n == 0:
+        return 0.0, 0.0, None
+    if n == 1:
+        return 1.0, 1.0, int(candidates[0])
+
+    best = (-1.0, 0.0, None)
+    for guess in candidates:
+        codes = table.matrix[guess, candidates]
+        win, guesses = 0.0, 1.0
+        for code in np.unique(codes):
+            if code == ALL_GREEN:
+                win += 1.0 / n
+                continue
+            part = candidates[codes == code]
+            part_win, part_guesses, _ = _solve(table, part.tobytes(), attempts_left - 1)
+            win += len(part) / n * part_win
+            guesses += len(part) / n * part_guesses
+        if win > best[0] + 1e-12 or (abs(win - best[0]) <= 1e-12 and guesses < best[1]):
+            best = (win, guesses, int(guess))
+    return best
+
+
+def solve_state(state: WordleState, wordlist):
+    """solve() applied to the candidates and remaining attempts of 'state'."""
+    state.legal_moves(wordlist)
+    return solve(state.table, state.candidates, state.max_attempts - len(state.history))
+
+
+def clear_cache():
+    _solve.cache_clear()
+
+
+# ===============================
+#  Drop-in leaf evaluator / solver
+# ===============================
+class EndgamePlayout:
+    """
+    Playout that returns the exact win probability once the candidate set
+    is at most 'threshold' words, and runs 'playout_fn' otherwise.
+    """
+
+    def __init__(self, playout_fn=None, threshold=ENDGAME_THRESHOLD):
+        self.playout_fn = playout_fn
+        self.threshold = threshold
+
+    def __call__(self, state: WordleState, wordlist):
+        if state.is_terminal():
+            return state.score()
+        if len(state.legal_moves(wordlist)) <= self.threshold:
+            return solve_state(state, wordlist)[0]
+        return (self.playout_fn or random_playout)(state, wordlist)
+
+    def __repr__(self):
+        return f"EndgamePlayout({solver_key(self.playout_fn)}, threshold={self.threshold})"
+
+
+class EndgameSolver:
+    """Solver that plays the exact best guess below 'threshold' candidates."""
+
+    def __init__(self, solver, threshold=ENDGAME_THRESHOLD):
+        self.solver = solver
+        self.threshold = threshold
+
+    def __call__(self, state: WordleState, wordlist, **kwargs):
+        if len(state.legal_moves(wordlist)) <= self.threshold:
+            _, _, guess = solve_state(state, wordlist)
+            if guess is not None:
+                return state.table.words[guess]
+        return self.solver(state, wordlist, **kwargs)
+
+    def __repr__(self):
+        return f"EndgameSolver({solver_key(self.solver)}, threshold={self.threshold})"
@@ -1,9 +1,19 @@
+import math
 import random
+import time
+import zlib
+from collections import OrderedDict
+from concurrent.futures import as_completed
+from functools import partial
+from statistics import NormalDist
 import numpy as np
-import matplotlib.pyplot as plt
-import pandas as pd
 
+from feedback import ALL_GREEN, table_for
 from wordle import WordleState
+from utils import derive_seed, seed_all, solver_key
+from opening_book import with_opening_book
+import instrumentation
+from results_store import ResultStore
 from playouts import (
     random_playout,
     entropy_playout,
@@ -21,43 +31,177 @@ from solvers import (
 )
 
 
-SOLVER_COLORS = {
-    "RandomSolver": "tab:blue",
-    "FlatMC (random)": "tab:green",
-    "FlatMC (entropy)": "tab:orange",
-    "UCT (random)": "tab:red",
-    "UCT (freq+)": "tab:purple",
-    "UCT+RAVE": "tab:cyan",
-    "UCT+GRAVE": "tab:brown",
-    "NMCS (level 1)": "tab:pink",
-    "NMCS (level 2)": "tab:olive",
-}
+# Figures moved to plots.py; still importable from here without paying the
+# matplotlib import unless they are used
+_PLOTS = ("SOLVER_COLORS", "plot_winrates", "plot_avg_guesses", "plot_histogram", "plot_cdf")
+
+
+def __getattr__(name):
+    if name in _PLOTS:
+        import plots
+        return getattr(plots, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 # ===============================
 #  Core evaluation
 # ===============================
-def play_game(secret, solver, wordlist, max_attempts=6):
-    """Play a full Wordle game with the given solver."""
+def play_game(secret, solver, wordlist, max_attempts=6, move_ms=None):
+    """
+    Play a full Wordle game with the given solver (traced if a tracer is active).
+    move_ms : optional list receiving the solver's time per move (ms).
+    """
     state = WordleState(secret, max_attempts=max_attempts)
+    tracer = instrumentation.TRACER
+    name = solver_key(solver) if tracer is not None else None
     while not state.is_terminal():
+        if tracer is not None:
+            tracer.begin_move(state, wordlist, name)
+        start = time.perf_counter()
         move = solver(state, wordlist)
+        if move_ms is not None:
+            move_ms.append((time.perf_counter() - start) * 1000.0)
+        if tracer is not None:
+            tracer.end_move(move)
         if move is None: 
             break
         state.play(move)
     return state
 
 
-def evaluate(solver, wordlist, n_games=50, verbose=False):
-    """Evaluate a solver across multiple games."""
-    results = []
-    secrets = random.sample(wordlist, min(n_games, len(wordlist)))
+def play_recorded_game(secret, solver, wordlist, seed=None):
+    """
+    Play one game after seeding the RNGs; returns its record for
+    results_store (secret, seed, guesses, n_guesses, win, move_ms, cpu_s).
+    """
+    if seed is not None:
+        seed_all(seed)
+    move_ms = []
+    cpu = time.process_time()
+    state = play_game(secret, solver, wordlist, move_ms=move_ms)
+    cpu = time.process_time() - cpu
+    won = state.is_won()
+    return {
+        "seed": seed,
+        "secret": secret,
+        "guesses": [guess for guess, _ in state.history],
+        "n_guesses": len(state.history) if won else 0,
+        "win": won,
+        "move_ms": move_ms,
+        "cpu_s": cpu,
+    }
+
+
+def play_seeded_game(secret, solver, wordlist, seed=None):
+    """Play one game after seeding the RNGs; returns #guesses if won else 0."""
+    return play_recorded_game(secret, solver, wordlist, seed)["n_guesses"]
+
+
+# Word list shared by every game of a worker process (set once by the initializer)
+_WORKER_WORDLIST = None
 
-    for secret in secrets:
-        state = play_game(secret, solver, wordlist)
+
+def _init_worker(wordlist):
+    global _WORKER_WORDLIST
+    _WORKER_WORDLIST = wordlist
+    table_for(wordlist)  # build or map the feedback table once per process
+
+
+def _worker_game(index, secret, solver, seed):
+    return index, play_recorded_game(secret, solver, _WORKER_WORDLIST, seed)
+
+
+def make_executor(wordlist, n_workers):
+    """Process pool whose workers hold 'wordlist' (and its mapped feedback table)."""
+    from concurrent.futures import ProcessPoolExecutor
+    return ProcessPoolExecutor(max_workers=n_workers, initializer=_init_worker,
+                               initargs=(wordlist,))
+
+
+def play_games(solver, wordlist, secrets, seeds, n_workers=1, executor=None, store=None,
+               name=None, on_result=None):
+    """
+    Play 'solver' against each secrets[i] with RNG seed seeds[i] (see evaluate()
+    for n_workers, executor, store and name). on_result(index, secret, guesses)
+    is called as each game completes.
+    Returns the number of guesses of each game (0 = lost), in order.
+    """
+    parallel = executor is not None or n_workers > 1
+    results = [0] * len(secrets)
+
+    own_store = isinstance(store, str)
+    if own_store:
+        store = ResultStore(store)
+    name = name or solver_key(solver)
+    config = solver_key(solver)
+    recorded = {}
+    if store is not None:
+        recorded = {(r["secret"], r["seed"]): r for r in store
+                    if r["solver"] == name and r.get("config") == config}
+
+    def record(index, game, replayed=False):
+        results[index] = game["n_guesses"]
+        if store is not None and not replayed:
+            store.append({"solver": name, "config": config, **game})
+        if on_result is not None:
+            on_result(index, secrets[index], game["n_guesses"])
+
+    todo = []
+    for i, secret in enumerate(secrets):
+        if (secret, seeds[i]) in recorded:
+            record(i, recorded[secret, seeds[i]], replayed=True)
+        else:
+            todo.append(i)
+
+    try:
+        if not parallel:
+            for i in todo:
+                record(i, play_recorded_game(secrets[i], solver, wordlist, seeds[i]))
+        elif todo:
+            pool = executor or make_executor(wordlist, n_workers)
+            try:
+                futures = [pool.submit(_worker_game, i, secrets[i], solver, seeds[i]) for i in todo]
+                for future in as_completed(futures):
+                    record(*future.result())
+            finally:
+                if executor is None:
+                    pool.shutdown()
+    finally:
+        if own_store:
+            store.close()
+    return results
+
+
+def evaluate(solver, wordlist, n_games=50, verbose=False, n_workers=1, seed=None,
+             executor=None, on_result=None, store=None, name=None):
+    """
+    Evaluate a solver across multiple games.
+    - n_workers : games are spread over a process pool when > 1
+      (the solver must then be picklable, e.g. a functools.partial)
+    - seed : master seed; secrets and per-game seeds derive from it, so results
+      do not depend on n_workers
+    - executor : existing pool from make_executor(), reused instead of a new one
+    - on_result(index, secret, guesses) : called as each game completes
+    - store : ResultStore (or its path) where each game is appended as soon
+      as it ends, under 'name' (default: solver_key(solver)). Games already
+      in the store for (name, solver_key, secret, seed) are not replayed, so
+      an interrupted run resumes where it stopped (pass a seed).
+    """
+    parallel = executor is not None or n_workers > 1
+    if seed is None and (parallel or store is not None):
+        seed = random.getrandbits(32)
+    rng = random if seed is None else random.Random(seed)
+    secrets = rng.sample(wordlist, min(n_games, len(wordlist)))
+    seeds = [None if seed is None else derive_seed(seed, i) for i in range(len(secrets))]
+
+    def report(index, secret, guesses):
         if verbose:
-            print(f"Secret: {secret}, Attempts: {len(state.attempts)}, Win: {state.score()}")
-        results.append(len(state.attempts) if state.score() == 1 else 0)
+            print(f"Secret: {secret}, Attempts: {guesses or 'fail'}, Win: {float(guesses > 0)}")
+        if on_result is not None:
+            on_result(index, secret, guesses)
+
+    results = play_games(solver, wordlist, secrets, seeds, n_workers=n_workers, executor=executor,
+                         store=store, name=name, on_result=report)
 
     successes = sum(1 for r in results if r > 0)
     win_rate = successes / len(results)
@@ -74,103 +218,287 @@ def evaluate(solver, wordlist, n_games=50, verbose=False):
 
 
 # ===============================
-#  Plots
+#  Exhaustive evaluation
 # ===============================
+def evaluate_exhaustive(solver, wordlist, max_attempts=6, seed=0, cache_size=100_000):
+    """
+    Evaluate a solver on every secret of 'wordlist' at once by branching on
+    feedback patterns: secrets sharing a history share one decision, and
+    decisions are memoized by WordleState.key() (transpositions included)
+    in an LRU cache of cache_size entries.
+    Each decision is taken on a state whose secret is the first of its group,
+    with RNGs seeded from (seed, state key): stochastic solvers are thus
+    reproducible, and the result is exact for solvers that only use the history.
+    Returns the same stats as evaluate(), plus the number of decisions computed.
+    """
+    cache = OrderedDict()
+    guesses = {}
+    computed = 0
+
+    def decide(history, secrets):
+        nonlocal computed
+        state = WordleState(secrets[0], max_attempts=max_attempts)
+        state.legal_moves(wordlist)
+        for guess, _ in history:
+            state.play(guess)
+        key = state.key()
+        if key in cache:
+            cache.move_to_end(key)
+            return cache[key]
+        # key[2] is the candidate-set bytes (the state is bound)
+        seed_all(derive_seed(seed, len(history), zlib.crc32(key[2])))
+        move = solver(state, wordlist)
+        computed += 1
+        cache[key] = move
+        if len(cache) > cache_size:
+            cache.popitem(last=False)
+        return move
+
+    table = table_for(wordlist)
+    stack = [((), list(wordlist))]
+    while stack:
+        history, secrets = stack.pop()
+        move = decide(history, secrets)
+        groups = {}
+        for secret in secrets:
+            groups.setdefault(None if move is None else table.code(move, secret), []).append(secret)
+        for code, group in groups.items():
+            if code == ALL_GREEN:
+                for secret in group:
+                    guesses[secret] = len(history) + 1
+            elif code is None or len(history) + 1 >= max_attempts:
+                for secret in group:
+                    guesses[secret] = 0
+            else:
+                stack.append((history + ((move, code),), group))
+
+    results = [guesses[secret] for secret in wordlist]
+    successes = sum(1 for r in results if r > 0)
+    return {
+        "n_games": len(results),
+        "win_rate": successes / len(results),
+        "avg_guesses": np.mean([r for r in results if r > 0]) if successes > 0 else 0,
+        "distribution": results,
+        "decisions": computed,
+    }
 
-def plot_winrates(df, save_path=None):
-    """Bar plot des win rates par solver (fond blanc style publication)."""
-    plt.figure(figsize=(10, 5), facecolor="white")
-    bars = plt.bar(df["Solver"], df["WinRate"], color="skyblue", edgecolor="black")
-    plt.xticks(rotation=30, ha="right")
-    plt.ylabel("Win Rate")
-    plt.title("Win Rate per Solver", fontsize=14)
-    for bar, val in zip(bars, df["WinRate"]):
-        plt.text(bar.get_x() + bar.get_width()/2, bar.get_height(), f"{val:.2f}",
-                 ha="center", va="bottom", fontsize=9)
-    if save_path:
-        plt.savefig(save_path, dpi=300, bbox_inches="tight", facecolor="white")
-    plt.show()
-
-
-def plot_avg_guesses(df, save_path=None):
-    """Bar plot du nombre moyen de guesses par solver."""
-    plt.figure(figsize=(10, 5), facecolor="white")
-    bars = plt.bar(df["Solver"], df["AvgGuesses"], color="lightgreen", edgecolor="black")
-    plt.xticks(rotation=30, ha="right")
-    plt.ylabel("Average Guesses (Wins Only)")
-    plt.title("Average Guesses per Solver", fontsize=14)
-    for bar, val in zip(bars, df["AvgGuesses"]):
-        plt.text(bar.get_x() + bar.get_width()/2, bar.get_height(), f"{val:.2f}",
-                 ha="center", va="bottom", fontsize=9)
-    if save_path:
-        plt.savefig(save_path, dpi=300, bbox_inches="tight", facecolor="white")
-    plt.show()
-
-
-def plot_histogram(df_dist, solvers_to_compare, save_path=None):
-    """Histogramme comparatif (distribution des guesses pour quelques solveurs)."""
-    plt.figure(figsize=(10, 5), facecolor="white")
-    for solver in solvers_to_compare:
-        subset = df_dist[(df_dist["Solver"] == solver) & (df_dist["Guesses"] != "fail")].copy()
-        subset["Guesses"] = subset["Guesses"].astype(int)
-        plt.bar(subset["Guesses"], subset["Count"], alpha=0.6, label=solver)
-    plt.xlabel("Number of guesses")
-    plt.ylabel("Frequency")
-    plt.title("Guess Distribution", fontsize=14)
-    plt.legend(frameon=False)
-    if save_path:
-        plt.savefig(save_path, dpi=300, bbox_inches="tight", facecolor="white")
-    plt.show()
-
-
-def plot_cdf(df_dist, solvers_to_compare, save_path=None):
-    """CDF comparative (probabilité cumulée de réussite)."""
-    plt.figure(figsize=(10, 5), facecolor="white")
-    for solver in solvers_to_compare:
-        subset = df_dist[(df_dist["Solver"] == solver) & (df_dist["Guesses"] != "fail")].copy()
-        subset["Guesses"] = subset["Guesses"].astype(int)
-        expanded = np.repeat(subset["Guesses"].values, subset["Count"].values)
-        expanded = np.sort(expanded)
-        cdf = np.arange(1, len(expanded)+1) / len(expanded)
-        plt.step(expanded, cdf, where="post", label=solver)
-    plt.xlabel("Number of guesses")
-    plt.ylabel("Cumulative Success Probability")
-    plt.title("CDF of Success", fontsize=14)
-    plt.legend(frameon=False)
-    if save_path:
-        plt.savefig(save_path, dpi=300, bbox_inches="tight", facecolor="white")
-    plt.show()
 
+# ===============================
+#  Adaptive (sequential) evaluation
+# ===============================
+# Cost of a lost game in paired comparisons (one more than the attempts allowed)
+LOSS_COST = 7
+
+
+def wilson_interval(successes, n, confidence=0.95):
+    """Wilson score interval of a binomial proportion."""
+    if n == 0:
+        return 0.0, 1.0
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+    p = successes / n
+    denom = 1 + z * z / n
+    centre = (p + z * z / (2 * n)) / denom
+    half = z * math.sqrt(p * (1 - p) / n + z * z / (4 * n * n)) / denom
+    return max(0.0, centre - half), min(1.0, centre + half)
 
 
-def run_comparisons(wordlist, n_games=50, save_path=None):
+def t_quantile(p, df):
+    """
+    Quantile of Student's t distribution: exact for df <= 2, Cornish-Fisher
+    expansion around the normal quantile otherwise (Abramowitz-Stegun 26.7.5).
+    """
+    if df == 1:
+        return math.tan(math.pi * (p - 0.5))
+    if df == 2:
+        return (2 * p - 1) / math.sqrt(2 * p * (1 - p))
+    z = NormalDist().inv_cdf(p)
+    terms = [(z ** 3 + z) / 4,
+             (5 * z ** 5 + 16 * z ** 3 + 3 * z) / 96,
+             (3 * z ** 7 + 19 * z ** 5 + 17 * z ** 3 - 15 * z) / 384,
+             (79 * z ** 9 + 776 * z ** 7 + 1482 * z ** 5 - 1920 * z ** 3 - 945 * z) / 92160]
+    return z + sum(term / df ** (k + 1) for k, term in enumerate(terms))
+
+
+def mean_interval(values, confidence=0.95):
+    """Student-t interval of a mean ((-inf, inf) below 2 values)."""
+    if len(values) < 2:
+        return -math.inf, math.inf
+    t = t_quantile(0.5 + confidence / 2, len(values) - 1)
+    values = np.asarray(values, dtype=float)
+    half = t * values.std(ddof=1) / math.sqrt(len(values))
+    return float(values.mean() - half), float(values.mean() + half)
+
+
+# Fewest common games before a paired comparison may be decided (a few
+# identical costs would otherwise give a zero-width interval)
+MIN_PAIRED_GAMES = 5
+
+
+def _paired(a, b, confidence):
+    """Paired comparison of two result lists over their common games (cost = guesses, LOSS_COST if lost)."""
+    n = min(len(a), len(b))
+    diff = [(x or LOSS_COST) - (y or LOSS_COST) for x, y in zip(a[:n], b[:n])]
+    lo, hi = mean_interval(diff, confidence)
+    return {"n": n, "diff": float(np.mean(diff)) if n else 0.0, "ci": (lo, hi),
+            "decided": n >= MIN_PAIRED_GAMES and (lo > 0 or hi < 0)}
+
+
+def evaluate_adaptive(solvers, wordlist, win_width=0.1, guesses_width=0.25, confidence=0.95,
+                      batch_size=20, min_games=None, max_games=None, seed=0, compare=False,
+                      n_workers=1, executor=None, store=None):
+    """
+    Sequential evaluation of several solvers ({name: solver}) on common
+    random secrets: every solver plays the same secrets with the same
+    per-game seeds, batch_size games at a time, and stops as soon as
+    - its win-rate (Wilson) and average-guess intervals are narrower than
+      win_width and guesses_width (the latter only once it has won twice;
+      never needed if it never wins), or
+    - with compare=True, its paired comparison (mean cost difference on the
+      common secrets, LOSS_COST per lost game) with every other solver
+      excludes 0 after at least MIN_PAIRED_GAMES common games, or
+    - it has played max_games games (default: the whole word list).
+    No solver stops before min_games games (default: batch_size). With
+    compare=True a stopped solver keeps playing while its comparison with a
+    running solver is undecided, so that comparison can still conclude.
+    Returns {"solvers": {name: evaluate() stats + "win_rate_ci",
+    "avg_guesses_ci", "stopped"}, "pairs": {(a, b): {"n", "diff", "ci", "decided"}}}
+    where diff < 0 means a needs fewer guesses than b.
+    """
+    max_games = min(max_games or len(wordlist), len(wordlist))
+    min_games = min(min_games or batch_size, max_games)
+    secrets = random.Random(seed).sample(wordlist, max_games)
+    seeds = [derive_seed(seed, i) for i in range(max_games)]
+    names = list(solvers)
+    results = {name: [] for name in names}
+    stopped = {}
+
+    own_executor = executor is None and n_workers > 1
+    if own_executor:
+        executor = make_executor(wordlist, n_workers)
+
+    def precise(res):
+        wins = [r for r in res if r > 0]
+        lo, hi = wilson_interval(len(wins), len(res), confidence)
+        if hi - lo > win_width:
+            return False
+        if not wins:
+            return True
+        lo, hi = mean_interval(wins, confidence)
+        return hi - lo <= guesses_width
+
+    def partner(name):
+        """A stopped solver still needed by an undecided comparison with a running one."""
+        return compare and len(results[name]) < max_games and any(
+            other not in stopped and not _paired(results[other], results[name], confidence)["decided"]
+            for other in names)
+
+    try:
+        while len(stopped) < len(names):
+            for name in [n for n in names if n not in stopped or partner(n)]:
+                start = len(results[name])
+                end = min(start + batch_size, max_games)
+                results[name] += play_games(solvers[name], wordlist, secrets[start:end], seeds[start:end],
+                                            executor=executor, store=store, name=name)
+
+            for name in names:
+                res = results[name]
+                if name in stopped or len(res) < min_games:
+                    continue
+                if len(res) >= max_games:
+                    stopped[name] = "max_games"
+                elif precise(res):
+                    stopped[name] = "precision"
+                elif compare and len(names) > 1 and all(
+                        _paired(res, results[other], confidence)["decided"]
+                        for other in names if other != name):
+                    stopped[name] = "decided"
+    finally:
+        if own_executor:
+            executor.shutdown()
+
+    report = {}
+    for name in names:
+        res = results[name]
+        wins = [r for r in res if r > 0]
+        report[name] = {
+            "n_games": len(res),
+            "win_rate": len(wins) / len(res),
+            "avg_guesses": np.mean(wins) if wins else 0,
+            "distribution": res,
+            "win_rate_ci": wilson_interval(len(wins), len(res), confidence),
+            "avg_guesses_ci": mean_interval(wins, confidence),
+            "stopped": stopped[name],
+        }
+    pairs = {(a, b): _paired(results[a], results[b], confidence)
+             for i, a in enumerate(names) for b in names[i + 1:]}
+    return {"solvers": report, "pairs": pairs}
+
+
+def run_comparisons(wordlist, n_games=50, save_path=None, n_workers=1, seed=None,
+                    use_book=False, store=None, adaptive=None):
     """
     Run experiments on all solvers + playouts.
+    With n_workers > 1 the games of every solver run on one shared process pool;
+    with a seed, all solvers face the same secrets.
+    With use_book, each solver plays its first two guesses from its cached
+    opening book (built on first use).
+    With a store (ResultStore or path), every game is appended to it as it
+    ends and a rerun with the same seed skips the games already recorded.
+    With adaptive (True, or a dict of evaluate_adaptive options), solvers
+    play common secrets in batches until their intervals are narrow enough
+    or their pairwise comparisons are decided, n_games being the maximum.
     Returns a pandas DataFrame with results.
     """
+    import pandas as pd
 
-
+    # functools.partial (not lambdas) so solvers can be sent to worker processes
     solvers = {
-    "RandomSolver": lambda s, wl: random_solver(s, wl),
-    "FlatMC (entropy)": lambda s, wl: flat_mc(s, wl, n_playouts=50, playout_fn=entropy_playout),
-    "UCT": lambda s, wl: uct_search(s, wl, n_iter=100, playout_fn=random_playout),
-    "UCT+GRAVE": lambda s, wl: uct_grave_search(s, wl, n_iter=100, playout_fn=frequency_plus_playout),
+    "RandomSolver": random_solver,
+    "FlatMC (entropy)": partial(flat_mc, n_playouts=50, playout_fn=entropy_playout),
+    "UCT": partial(uct_search, n_iter=100, playout_fn=random_playout),
+    "UCT+GRAVE": partial(uct_grave_search, n_iter=100, playout_fn=frequency_plus_playout),
 }
 
+    if use_book:
+        solvers = {f"{name} + book": with_opening_book(solver, wordlist, n_workers=n_workers)
+                   for name, solver in solvers.items()}
 
-    
-
-
-
+    executor = make_executor(wordlist, n_workers) if n_workers > 1 else None
+    own_store = isinstance(store, str)
+    if own_store:
+        store = ResultStore(store)
     records = []
-    for name, solver in solvers.items():
-        print(f"=== Evaluating {name} ===")
-        stats = evaluate(solver, wordlist, n_games=n_games)
-        records.append({
-            "Solver": name,
-            "WinRate": stats["win_rate"],
-            "AvgGuesses": stats["avg_guesses"],
-        })
+    try:
+        if adaptive:
+            options = {"compare": True, **(adaptive if isinstance(adaptive, dict) else {})}
+            print(f"=== Evaluating {len(solvers)} solvers (adaptive) ===")
+            result = evaluate_adaptive(solvers, wordlist, max_games=n_games, seed=seed or 0,
+                                       executor=executor, store=store, **options)
+            for name, stats in result["solvers"].items():
+                records.append({
+                    "Solver": name,
+                    "WinRate": stats["win_rate"],
+                    "AvgGuesses": stats["avg_guesses"],
+                    "Games": stats["n_games"],
+                })
+            for (a, b), pair in result["pairs"].items():
+                verdict = (f"{a if pair['diff'] < 0 else b} better" if pair["decided"] else "undecided")
+                print(f"{a} vs {b}: {pair['diff']:+.3f} guesses/game over {pair['n']} games ({verdict})")
+        else:
+            for name, solver in solvers.items():
+                print(f"=== Evaluating {name} ===")
+                stats = evaluate(solver, wordlist, n_games=n_games, seed=seed, executor=executor,
+                                 store=store, name=name)
+                records.append({
+                    "Solver": name,
+                    "WinRate": stats["win_rate"],
+                    "AvgGuesses": stats["avg_guesses"],
+                })
+    finally:
+        if executor is not None:
+            executor.shutdown()
+        if own_store:
+            store.close()
 
     df = pd.DataFrame(records)
 
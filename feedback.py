@@ -0,0 +1,237 @@
+import hashlib
+import os
+import tempfile
+
+import numpy as np
+
+
+# ===============================
+#  Pattern encoding
+# ===============================
+WORD_LENGTH = 5
+N_PATTERNS = 3 ** WORD_LENGTH          # 243 distinct feedbacks
+ALL_GREEN = N_PATTERNS - 1             # "GGGGG" -> 242
+
+_DIGITS = {"B": 0, "Y": 1, "G": 2}
+_WEIGHTS = [3 ** i for i in range(WORD_LENGTH)]
+
+
+def encode_pattern(feedback):
+    """Encode a 'G'/'Y'/'B' feedback string as a base-3 integer in [0, 242]."""
+    return sum(_DIGITS[c] * w for c, w in zip(feedback, _WEIGHTS))
+
+
+def _decode(code):
+    letters = []
+    for _ in range(WORD_LENGTH):
+        code, digit = divmod(code, 3)
+        letters.append("BYG"[digit])
+    return "".join(letters)
+
+
+# Lookup table code -> feedback string
+PATTERNS = tuple(_decode(code) for code in range(N_PATTERNS))
+
+
+def decode_pattern(code):
+    """Inverse of encode_pattern."""
+    return PATTERNS[code]
+
+
+def pattern_code(candidate, guess):
+    """
+    Feedback code of 'guess' if the secret were 'candidate'.
+    Same rules as WordleState.feedback_sim, without building a string.
+    """
+    code = 0
+    for i, c in enumerate(guess):
+        if c == candidate[i]:
+            code += 2 * _WEIGHTS[i]
+        elif c in candidate:
+            code += _WEIGHTS[i]
+    return code
+
+
+# ===============================
+#  Guess x secret matrix
+# ===============================
+def build_feedback_matrix(words):
+    """
+    Dense uint8 matrix M with M[g, s] = pattern_code(words[s], words[g]).
+    Computed position by position with NumPy broadcasting.
+    """
+    n = len(words)
+    if n == 0:
+        return np.zeros((0, 0), dtype=np.uint8)
+
+    codes = np.array([[ord(c) for c in w] for w in words], dtype=np.int64)
+    alphabet, letters = np.unique(codes, return_inverse=True)
+    letters = letters.reshape(n, WORD_LENGTH)
+
+    # present[s, l] : letter l appears somewhere in secret s
+    present = np.zeros((n, len(alphabet)), dtype=bool)
+    present[np.arange(n)[:, None], letters] = True
+
+    matrix = np.zeros((n, n), dtype=np.uint8)
+    for i in range(WORD_LENGTH):
+        green = letters[:, None, i] == letters[None, :, i]
+        yellow = present[:, letters[:, i]].T
+        digit = np.where(green, 2, yellow).astype(np.uint8)
+        matrix += digit * np.uint8(_WEIGHTS[i])
+    return matrix
+
+
+class FeedbackTable:
+    """
+    Precomputed feedback patterns for a fixed word list.
+    - words  : tuple of words (row/column order of the matrix)
+    - index  : word -> position
+    - matrix : uint8 array (guess x secret) of pattern codes
+    """
+
+    def __init__(self, words, matrix=None):
+        self.words = tuple(words)
+        self.index = {w: i for i, w in enumerate(self.words)}
+        if matrix is None:
+            matrix = build_feedback_matrix(self.words)
+        # Plain ndarray view: memmap subclass indexing is noticeably slower
+        self.matrix = np.asarray(matrix)
+
+    def __len__(self):
+        return len(self.words)
+
+    def code(self, guess, secret):
+        """Pattern code of 'guess' against 'secret' (lookup when both are known)."""
+        g = self.index.get(guess)
+        s = self.index.get(secret)
+        if g is None or s is None:
+            return pattern_code(secret, guess)
+        return int(self.matrix[g, s])
+
+    def filter(self, candidates, guess, code):
+        """Subset of the index array 'candidates' consistent with (guess, code)."""
+        g = self.index.get(guess)
+        if g is None:
+            keep = [pattern_code(self.words[i], guess) == code for i in candidates]
+            return candidates[np.array(keep, dtype=bool)]
+        return candidates[self.matrix[g, candidates] == code]
+
+    def all_indices(self):
+        return np.arange(len(self.words))
+
+
+# ===============================
+#  On-disk cache (memory-mapped)
+# ===============================
+CACHE_VERSION = 1
+# Bump when the feedback rules above change: it invalidates every cache file
+FEEDBACK_RULES = "green-exact/yellow-anywhere"
+DEFAULT_CACHE_DIR = os.environ.get(
+    "WORDLE_CACHE_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache"))
+
+_MAGIC = b"WRDLFBM\0"
+_HEADER_SIZE = 64
+
+
+def wordlist_hash(words):
+    """SHA-256 of the word list, the feedback rules and the cache version."""
+    h = hashlib.sha256(f"{CACHE_VERSION}|{FEEDBACK_RULES}|".encode("utf-8"))
+    h.update("\n".join(words).encode("utf-8"))
+    return h.hexdigest()
+
+
+def cache_path(words, cache_dir=DEFAULT_CACHE_DIR):
+    return os.path.join(cache_dir, f"feedback-{wordlist_hash(words)[:32]}.bin")
+
+
+def _header(n):
+    header = _MAGIC + CACHE_VERSION.to_bytes(4, "little") + n.to_bytes(4, "little")
+    return header.ljust(_HEADER_SIZE, b"\0")
+
+
+def save_matrix(matrix, path):
+    """Write the matrix atomically (temp file + rename) so readers never see a partial file."""
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path) or ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(_header(matrix.shape[0]))
+            f.write(np.ascontiguousarray(matrix, dtype=np.uint8).tobytes())
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+
+
+def open_matrix(path, n):
+    """Memory-map a cached matrix read-only. Returns None if missing or stale."""
+    try:
+        with open(path, "rb") as f:
+            header = f.read(_HEADER_SIZE)
+        if header != _header(n) or os.path.getsize(path) != _HEADER_SIZE + n * n:
+            return None
+    except OSError:
+        return None
+    return np.memmap(path, dtype=np.uint8, mode="r", offset=_HEADER_SIZE, shape=(n, n))
+
+
+def load_table(words, cache_dir=DEFAULT_CACHE_DIR):
+    """
+    FeedbackTable backed by the on-disk cache for this word list.
+    The matrix is built and written only when no valid cache file exists.
+    """
+    words = tuple(words)
+    if not words:
+        return FeedbackTable(words)
+    path = cache_path(words, cache_dir)
+    matrix = open_matrix(path, len(words))
+    if matrix is None:
+        save_matrix(build_feedback_matrix(words), path)
+        matrix = open_matrix(path, len(words))
+    return FeedbackTable(words, matrix)
+
+
+class WordList(list):
+    """
+    List of words that lazily attaches to its cached FeedbackTable.
+    Pickles as a plain word list: each process maps the cache file itself.
+    """
+
+    def __init__(self, words=(), cache_dir=DEFAULT_CACHE_DIR):
+        super().__init__(words)
+        self.cache_dir = cache_dir
+        self._table = None
+
+    @property
+    def table(self):
+        if self._table is None or len(self._table) != len(self):
+            if self.cache_dir is None:
+                self._table = FeedbackTable(self)
+            else:
+                self._table = load_table(self, self.cache_dir)
+        return self._table
+
+    def __reduce__(self):
+        return (WordList, (list(self), self.cache_dir))
+
+
+_TABLES = {}
+_MAX_TABLES = 32
+
+
+def table_for(wordlist):
+    """
+    Return the FeedbackTable for 'wordlist', building it once.
+    Word lists are treated as immutable once a table has been built.
+    """
+    if isinstance(wordlist, WordList):
+        return wordlist.table
+    entry = _TABLES.get(id(wordlist))
+    if entry is not None and entry[0] is wordlist and len(entry[1]) == len(wordlist):
+        return entry[1]
+    if len(_TABLES) >= _MAX_TABLES:
+        _TABLES.clear()
+    table = FeedbackTable(wordlist)
+    _TABLES[id(wordlist)] = (wordlist, table)
+    return table
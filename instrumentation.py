@@ -0,0 +1,149 @@
+import json
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+
+import numpy as np
+
+
+# Active tracer, or None. Hot paths read it once and skip all bookkeeping
+# when tracing is disabled.
+TRACER = None
+
+
+# ===============================
+#  Tracer
+# ===============================
+class Tracer:
+    """
+    Collects one record per move: solver, move number, candidate-set size,
+    wall time, time per MCTS phase (selection, expansion, simulation,
+    backpropagation), iterations, tree size and playout count/length.
+    Records are appended as JSON lines to 'path' (if given) and kept in
+    self.records for summary().
+    """
+
+    def __init__(self, path=None):
+        self.path = path
+        self.records = []
+        self._file = open(path, "a", encoding="utf-8") if path else None
+        self._move = None
+        self._start = 0.0
+
+    # --- move boundaries (called by experiments.play_game) ---
+    def begin_move(self, state, wordlist, solver=""):
+        self._move = {
+            "solver": solver,
+            "move": len(state.history),
+            "candidates": len(state.legal_moves(wordlist)),
+            "phases": defaultdict(float),
+            "iterations": 0,
+            "tree_size": 0,
+            "playouts": 0,
+            "playout_steps": 0,
+        }
+        self._start = time.perf_counter()
+
+    def end_move(self, guess):
+        if self._move is None:
+            return None
+        record = self._move
+        self._move = None
+        record["wall_ms"] = (time.perf_counter() - self._start) * 1000.0
+        record["phases"] = {name: seconds * 1000.0 for name, seconds in record["phases"].items()}
+        record["guess"] = guess
+        self.records.append(record)
+        if self._file is not None:
+            self._file.write(json.dumps(record) + "\n")
+            self._file.flush()
+        return record
+
+    # --- hooks (called by solvers and playouts) ---
+    def phase(self, name, seconds):
+        if self._move is not None:
+            self._move["phases"][name] += seconds
+
+    def search(self, iterations, tree_size=0):
+        if self._move is not None:
+            self._move["iterations"] += iterations
+            self._move["tree_size"] = max(self._move["tree_size"], tree_size)
+
+    def playout(self, steps, count=1):
+        if self._move is not None:
+            self._move["playouts"] += count
+            self._move["playout_steps"] += steps
+
+    # --- reporting ---
+    def summary(self):
+        """Per-solver aggregates of the recorded moves."""
+        by_solver = defaultdict(list)
+        for record in self.records:
+            by_solver[record["solver"]].append(record)
+
+        summary = {}
+        for solver, records in by_solver.items():
+            wall = np.array([r["wall_ms"] for r in records])
+            phases = defaultdict(float)
+            for r in records:
+                for name, ms in r["phases"].items():
+                    phases[name] += ms
+            playouts = sum(r["playouts"] for r in records)
+            summary[solver] = {
+                "moves": len(records),
+                "wall_ms_mean": float(wall.mean()),
+                "wall_ms_p50": float(np.percentile(wall, 50)),
+                "wall_ms_p95": float(np.percentile(wall, 95)),
+                "phase_share": {name: ms / wall.sum() for name, ms in phases.items()} if wall.sum() else {},
+                "iterations_mean": float(np.mean([r["iterations"] for r in records])),
+                "tree_size_mean": float(np.mean([r["tree_size"] for r in records])),
+                "candidates_mean": float(np.mean([r["candidates"] for r in records])),
+                "playout_length_mean": (sum(r["playout_steps"] for r in records) / playouts
+                                        if playouts else 0.0),
+            }
+        return summary
+
+    def report(self):
+        """Human-readable summary()."""
+        lines = []
+        for solver, s in self.summary().items():
+            lines.append(f"=== {solver} ({s['moves']} moves) ===")
+            lines.append(f"  wall ms/move : mean {s['wall_ms_mean']:.2f}  "
+                         f"p50 {s['wall_ms_p50']:.2f}  p95 {s['wall_ms_p95']:.2f}")
+            for name, share in sorted(s["phase_share"].items(), key=lambda item: -item[1]):
+                lines.append(f"  {name:<16}: {share:6.1%}")
+            lines.append(f"  iterations   : {s['iterations_mean']:.1f}/move, "
+                         f"tree {s['tree_size_mean']:.1f} nodes")
+            lines.append(f"  candidates   : {s['candidates_mean']:.1f}/move, "
+                         f"playout length {s['playout_length_mean']:.2f}")
+        return "\n".join(lines)
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+# ===============================
+#  Activation
+# ===============================
+def enable(tracer):
+    global TRACER
+    TRACER = tracer
+    return tracer
+
+
+def disable():
+    global TRACER
+    tracer, TRACER = TRACER, None
+    return tracer
+
+
+@contextmanager
+def tracing(path=None):
+    """Trace every move played inside the block: `with tracing("trace.jsonl") as t:`."""
+    tracer = enable(Tracer(path))
+    try:
+        yield tracer
+    finally:
+        disable()
+        tracer.close()
@@ -1,29 +1,17 @@
-from utils import load_wordlist
-from experiments import (
-    run_comparisons,
-    plot_winrates,
-    plot_avg_guesses,
-    plot_histogram,
-    plot_cdf
-)
-import pandas as pd 
+import sys
 
-if __name__ == "__main__":
- 
-    words = load_wordlist("wordlist.txt", limit=1000)
-
-    print("\n⚡ Running main experiments...")
-    df = run_comparisons(words, n_games=50, save_path="results.csv")
+from cli import main
 
-  
-    df_dist = pd.read_csv("distribution.csv")
 
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        # e.g. python main.py solve --history crane:BYBGB (see cli.py)
+        sys.exit(main())
 
-    plot_winrates(df, save_path="plot_winrate.png")
-    plot_avg_guesses(df, save_path="plot_avg_guesses.png")
-
-    solvers_to_compare = ["RandomSolver", "FlatMC (entropy)", "UCT+RAVE", "UCT+GRAVE"]
-    plot_histogram(df_dist, solvers_to_compare, save_path="plot_histogram.png")
-    plot_cdf(df_dist, solvers_to_compare, save_path="plot_cdf.png")
+    print("\n⚡ Running main experiments...")
+    # Every game goes to games.jsonl as it ends: rerunning resumes an interrupted run
+    main(["compare", "--limit", "1000", "--games", "50", "--seed", "0",
+          "--save", "results.csv", "--store", "games.jsonl"])
+    main(["plot", "--store", "games.jsonl"])
 
     print("\n Figures générées : plot_winrate.png, plot_avg_guesses.png, plot_histogram.png, plot_cdf.png")
@@ -0,0 +1,159 @@
+import hashlib
+import json
+import os
+import random
+from collections import Counter
+
+from feedback import ALL_GREEN, DEFAULT_CACHE_DIR, table_for, wordlist_hash
+from utils import derive_seed, seed_all, solver_key
+from wordle import WordleState
+
+
+BOOK_VERSION = 1
+
+
+# ===============================
+#  Opening book
+# ===============================
+class OpeningBook:
+    """
+    Precomputed first guess and second guess for every feedback of the first.
+    - first  : first guess
+    - second : {pattern code of the first guess: second guess}
+    """
+
+    def __init__(self, first, second):
+        self.first = first
+        self.second = dict(second)
+
+    def lookup(self, state):
+        """Book move for 'state', or None when out of book."""
+        history = state.history
+        if not history:
+            return self.first
+        if len(history) == 1 and history[0][0] == self.first:
+            return self.second.get(history[0][1])
+        return None
+
+    def to_dict(self):
+        return {"first": self.first, "second": {str(code): move for code, move in self.second.items()}}
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data["first"], {int(code): move for code, move in data["second"].items()})
+
+
+def book_path(solver, wordlist, cache_dir=DEFAULT_CACHE_DIR):
+    """Book file keyed by the word list hash and the solver configuration."""
+    key = f"{wordlist_hash(wordlist)}|{solver_key(solver)}".encode("utf-8")
+    return os.path.join(cache_dir, f"book-{hashlib.sha256(key).hexdigest()[:32]}.json")
+
+
+def save_book(book, path, solver, wordlist):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    data = {"version": BOOK_VERSION, "wordlist": wordlist_hash(wordlist),
+            "solver": solver_key(solver), **book.to_dict()}
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(data, f)
+    os.replace(tmp, path)
+
+
+def load_book(path, solver, wordlist):
+    """Load a book, or None if missing or built for another list/solver."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if (data.get("version") != BOOK_VERSION or data.get("wordlist") != wordlist_hash(wordlist)
+            or data.get("solver") != solver_key(solver)):
+        return None
+    return OpeningBook.from_dict(data)
+
+
+# ===============================
+#  Building
+# ===============================
+def position_move(solver, wordlist, history, secrets, seed):
+    """
+    Solver move at the position reached by 'history', by plurality over
+    states whose secret is each of 'secrets' (all consistent with history).
+    Solvers that only look at the history vote unanimously.
+    """
+    votes = Counter()
+    for i, secret in enumerate(secrets):
+        seed_all(derive_seed(seed, i))
+        state = WordleState(secret)
+        for guess, _ in history:
+            state.play(guess)
+        votes[solver(state, wordlist)] += 1
+    return max(votes, key=lambda move: (votes[move], move))
+
+
+def _positions(first, wordlist):
+    """Secrets of wordlist grouped by the feedback code of 'first'."""
+    table = table_for(wordlist)
+    groups = {}
+    for secret in wordlist:
+        groups.setdefault(table.code(first, secret), []).append(secret)
+    return groups
+
+
+def build_opening_book(solver, wordlist, n_samples=8, seed=0, n_workers=1):
+    """
+    Compute the book of 'solver' (must be picklable when n_workers > 1).
+    Each position is decided by n_samples searches with secrets drawn from
+    the words consistent with it; second-guess positions run in parallel.
+    """
+    rng = random.Random(seed)
+
+    def sample(secrets):
+        return rng.sample(secrets, min(n_samples, len(secrets)))
+
+    first = position_move(solver, wordlist, (), sample(list(wordlist)), derive_seed(seed, 0))
+    groups = _positions(first, wordlist)
+    codes = sorted(code for code in groups if code != ALL_GREEN)
+    jobs = [(solver, wordlist, ((first, code),), sample(groups[code]), derive_seed(seed, 1, code))
+            for code in codes]
+
+    if n_workers > 1:
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=n_workers) as pool:
+            moves = list(pool.map(position_move, *zip(*jobs))) if jobs else []
+    else:
+        moves = [position_move(*job) for job in jobs]
+
+    return OpeningBook(first, dict(zip(codes, moves)))
+
+
+def load_or_build_book(solver, wordlist, cache_dir=DEFAULT_CACHE_DIR, **build_kwargs):
+    """Book from the on-disk cache, built and saved on first use."""
+    path = book_path(solver, wordlist, cache_dir)
+    book = load_book(path, solver, wordlist)
+    if book is None:
+        book = build_opening_book(solver, wordlist, **build_kwargs)
+        save_book(book, path, solver, wordlist)
+    return book
+
+
+class BookSolver:
+    """Solver that plays book moves and falls back to 'solver' out of book."""
+
+    def __init__(self, solver, book):
+        self.solver = solver
+        self.book = book
+
+    def __call__(self, state, wordlist, **kwargs):
+        move = self.book.lookup(state)
+        if move is not None:
+            return move
+        return self.solver(state, wordlist, **kwargs)
+
+    def __repr__(self):
+        return f"book({solver_key(self.solver)})"
+
+
+def with_opening_book(solver, wordlist, cache_dir=DEFAULT_CACHE_DIR, **build_kwargs):
+    """Wrap 'solver' with its (cached) opening book for 'wordlist'."""
+    return BookSolver(solver, load_or_build_book(solver, wordlist, cache_dir, **build_kwargs))
@@ -1,7 +1,16 @@
 import random
-import math
 from collections import Counter
+import numpy as np
+import instrumentation
+from feedback import ALL_GREEN
 from wordle import WordleState
+from scoring import state_entropies
+
+
+def _record(start: WordleState, end: WordleState):
+    """Report the playout length to the active tracer, if any."""
+    if instrumentation.TRACER is not None:
+        instrumentation.TRACER.playout(len(end.history) - len(start.history))
 
 
 # ===============================
@@ -13,36 +22,90 @@ def random_playout(state: WordleState, wordlist):
     while not s.is_terminal():
         move = random.choice(s.legal_moves(wordlist))
         s.play(move)
+    _record(state, s)
     return 1.0 if s.is_won() else 0.0
 
 
+# ===============================
+#  Batched Random Playouts
+# ===============================
+def batch_random_playout(state: WordleState, wordlist, k):
+    """
+    Simulate k independent random playouts at once.
+    Each rollout keeps a boolean mask over the state's candidates; at every
+    step all active rollouts pick a uniform random candidate, get their
+    feedback by matrix lookup and narrow their mask.
+    Returns the array of the k rewards (1.0 if win else 0.0).
+    """
+    if state.is_terminal():
+        if instrumentation.TRACER is not None:
+            instrumentation.TRACER.playout(0, k)
+        return np.full(k, state.score())
+    state.legal_moves(wordlist)
+    table, cands = state.table, state.candidates
+    secret = table.index.get(state.secret)
+
+    mask = None  # all candidates still open in every rollout
+    won = np.zeros(k, dtype=bool)
+    active = np.ones(k, dtype=bool)
+    steps = 0
+    for _ in range(state.max_attempts - len(state.history)):
+        steps += int(active.sum())
+        if mask is None:
+            guesses = cands[np.random.randint(len(cands), size=k)]
+        else:
+            # Only keep the columns still open in some rollout
+            open_cols = mask.any(axis=0)
+            mask, cands = mask[:, open_cols], cands[open_cols]
+            # Uniform choice among each row's remaining candidates
+            keys = np.where(mask, np.random.random(mask.shape), -1.0)
+            guesses = cands[np.argmax(keys, axis=1)]
+        if secret is not None:
+            codes = table.matrix[guesses, secret]
+        else:
+            codes = np.array([state.feedback_code(state.secret, table.words[g]) for g in guesses])
+        won |= active & (codes == ALL_GREEN)
+        consistent = table.matrix[guesses[:, None], cands[None, :]] == codes[:, None]
+        mask = consistent if mask is None else mask & consistent
+        mask[won] = False
+        active = mask.any(axis=1)
+        if not active.any():
+            break
+    if instrumentation.TRACER is not None:
+        instrumentation.TRACER.playout(steps, k)
+    return won.astype(float)
+
+
+def run_playouts(state: WordleState, wordlist, playout_fn=None, k=1):
+    """
+    Rewards of k playouts of playout_fn (random by default) from state,
+    vectorized when the playout has a batched version.
+    """
+    playout_fn = playout_fn or random_playout
+    batched = BATCHED_PLAYOUTS.get(playout_fn)
+    if batched is not None and k > 1:
+        return batched(state, wordlist, k)
+    return np.array([playout_fn(state, wordlist) for _ in range(k)], dtype=float)
+
+
+# Playouts with a vectorized k-rollout version
+BATCHED_PLAYOUTS = {random_playout: batch_random_playout}
+
+
 # ===============================
 #  Entropy Playout
 # ===============================
 def entropy_playout(state: WordleState, wordlist):
     """
-    Choose the move that maximizes information gain (entropy).
-    Then play until terminal.
+    Choose the move that maximizes information gain (entropy)
+    over the remaining candidates. Then play until terminal.
     """
     s = state.clone()
     while not s.is_terminal():
         moves = s.legal_moves(wordlist)
-        best_move, best_entropy = None, -float("inf")
-
-        for move in moves:
-            feedback_counts = Counter()
-            for w in wordlist:
-                # ✅ corrige : utiliser feedback_sim
-                feedback = s.feedback_sim(w, move)
-                feedback_counts[feedback] += 1
-
-            total = sum(feedback_counts.values())
-            entropy = -sum((count / total) * math.log2(count / total)
-                           for count in feedback_counts.values())
-            if entropy > best_entropy:
-                best_entropy, best_move = entropy, move
-
-        s.play(best_move)
+        entropies = state_entropies(s, wordlist)
+        s.play(moves[int(np.argmax(entropies))])
+    _record(state, s)
     return 1.0 if s.is_won() else 0.0
 
 
@@ -66,6 +129,7 @@ def frequency_playout(state: WordleState, wordlist):
         best_move = max(moves, key=score)
         s.play(best_move)
 
+    _record(state, s)
     return 1.0 if s.is_won() else 0.0
 
 
@@ -75,36 +139,22 @@ def frequency_playout(state: WordleState, wordlist):
 def entropy_plus_playout(state: WordleState, wordlist, alpha=0.7):
     """
     Hybrid playout:
-    - Maximize entropy (info gain)
+    - Maximize entropy (info gain) over the remaining candidates
     - Encourage diversity of letters in guess
     alpha: weight [0,1] for entropy vs diversity
     """
     s = state.clone()
     while not s.is_terminal():
         moves = s.legal_moves(wordlist)
-        best_move, best_score = None, -float("inf")
-
-        for move in moves:
-            # Compute entropy
-            feedback_counts = Counter()
-            for w in wordlist:
-                # ✅ corrige : utiliser feedback_sim
-                feedback = s.feedback_sim(w, move)
-                feedback_counts[feedback] += 1
-
-            total = sum(feedback_counts.values())
-            entropy = -sum((count / total) * math.log2(count / total)
-                           for count in feedback_counts.values())
+        entropies = state_entropies(s, wordlist)
 
-            # Diversity = unique letters in the word
-            diversity = len(set(move))
+        # Diversity = unique letters in the word
+        diversity = np.array([len(set(move)) for move in moves])
 
-            score = alpha * entropy + (1 - alpha) * diversity
-            if score > best_score:
-                best_score, best_move = score, move
-
-        s.play(best_move)
+        scores = alpha * entropies + (1 - alpha) * diversity
+        s.play(moves[int(np.argmax(scores))])
 
+    _record(state, s)
     return 1.0 if s.is_won() else 0.0
 
 
@@ -133,4 +183,5 @@ def frequency_plus_playout(state: WordleState, wordlist, alpha=0.6):
         best_move = max(moves, key=score)
         s.play(best_move)
 
+    _record(state, s)
     return 1.0 if s.is_won() else 0.0
@@ -0,0 +1,103 @@
+"""
+Figures of the experiments (matplotlib/pandas are only imported here).
+Each plot takes the results/distribution table, or a ResultStore whose
+games are aggregated by streaming over the file.
+"""
+import numpy as np
+import matplotlib.pyplot as plt
+
+from results_store import ResultStore
+
+
+SOLVER_COLORS = {
+    "RandomSolver": "tab:blue",
+    "FlatMC (random)": "tab:green",
+    "FlatMC (entropy)": "tab:orange",
+    "UCT (random)": "tab:red",
+    "UCT (freq+)": "tab:purple",
+    "UCT+RAVE": "tab:cyan",
+    "UCT+GRAVE": "tab:brown",
+    "NMCS (level 1)": "tab:pink",
+    "NMCS (level 2)": "tab:olive",
+}
+
+
+def _summary(df):
+    return df.summary_frame() if isinstance(df, ResultStore) else df
+
+
+def _distribution(df_dist):
+    return df_dist.distribution_frame() if isinstance(df_dist, ResultStore) else df_dist
+
+
+# ===============================
+#  Plots
+# ===============================
+
+def plot_winrates(df, save_path=None):
+    """Bar plot des win rates par solver (fond blanc style publication)."""
+    df = _summary(df)
+    plt.figure(figsize=(10, 5), facecolor="white")
+    bars = plt.bar(df["Solver"], df["WinRate"], color="skyblue", edgecolor="black")
+    plt.xticks(rotation=30, ha="right")
+    plt.ylabel("Win Rate")
+    plt.title("Win Rate per Solver", fontsize=14)
+    for bar, val in zip(bars, df["WinRate"]):
+        plt.text(bar.get_x() + bar.get_width()/2, bar.get_height(), f"{val:.2f}",
+                 ha="center", va="bottom", fontsize=9)
+    if save_path:
+        plt.savefig(save_path, dpi=300, bbox_inches="tight", facecolor="white")
+    plt.show()
+
+
+def plot_avg_guesses(df, save_path=None):
+    """Bar plot du nombre moyen de guesses par solver."""
+    df = _summary(df)
+    plt.figure(figsize=(10, 5), facecolor="white")
+    bars = plt.bar(df["Solver"], df["AvgGuesses"], color="lightgreen", edgecolor="black")
+    plt.xticks(rotation=30, ha="right")
+    plt.ylabel("Average Guesses (Wins Only)")
+    plt.title("Average Guesses per Solver", fontsize=14)
+    for bar, val in zip(bars, df["AvgGuesses"]):
+        plt.text(bar.get_x() + bar.get_width()/2, bar.get_height(), f"{val:.2f}",
+                 ha="center", va="bottom", fontsize=9)
+    if save_path:
+        plt.savefig(save_path, dpi=300, bbox_inches="tight", facecolor="white")
+    plt.show()
+
+
+def plot_histogram(df_dist, solvers_to_compare, save_path=None):
+    """Histogramme comparatif (distribution des guesses pour quelques solveurs)."""
+    df_dist = _distribution(df_dist)
+    plt.figure(figsize=(10, 5), facecolor="white")
+    for solver in solvers_to_compare:
+        subset = df_dist[(df_dist["Solver"] == solver) & (df_dist["Guesses"] != "fail")].copy()
+        subset["Guesses"] = subset["Guesses"].astype(int)
+        plt.bar(subset["Guesses"], subset["Count"], alpha=0.6, label=solver)
+    plt.xlabel("Number of guesses")
+    plt.ylabel("Frequency")
+    plt.title("Guess Distribution", fontsize=14)
+    plt.legend(frameon=False)
+    if save_path:
+        plt.savefig(save_path, dpi=300, bbox_inches="tight", facecolor="white")
+    plt.show()
+
+
+def plot_cdf(df_dist, solvers_to_compare, save_path=None):
+    """CDF comparative (probabilité cumulée de réussite)."""
+    df_dist = _distribution(df_dist)
+    plt.figure(figsize=(10, 5), facecolor="white")
+    for solver in solvers_to_compare:
+        subset = df_dist[(df_dist["Solver"] == solver) & (df_dist["Guesses"] != "fail")].copy()
+        subset["Guesses"] = subset["Guesses"].astype(int)
+        expanded = np.repeat(subset["Guesses"].values, subset["Count"].values)
+        expanded = np.sort(expanded)
+        cdf = np.arange(1, len(expanded)+1) / len(expanded)
+        plt.step(expanded, cdf, where="post", label=solver)
+    plt.xlabel("Number of guesses")
+    plt.ylabel("Cumulative Success Probability")
+    plt.title("CDF of Success", fontsize=14)
+    plt.legend(frameon=False)
+    if save_path:
+        plt.savefig(save_path, dpi=300, bbox_inches="tight", facecolor="white")
+    plt.show()
@@ -0,0 +1,131 @@
+"""
+Append-only store of finished games (one JSON line per game).
+
+Record: {"solver": name, "config": solver_key, "seed": per-game seed,
+"secret": word, "guesses": [words], "n_guesses": int (0 = lost),
+"win": bool, "move_ms": [latency of each move], "cpu_s": CPU seconds}.
+Every game is written and flushed as soon as it ends, so a crashed run
+loses at most the game in progress and can resume by skipping the
+(solver, config, secret, seed) tuples already recorded. All aggregates are
+computed by streaming over the file, per (solver, config).
+"""
+import json
+import os
+from collections import Counter, defaultdict
+
+
+class ResultStore:
+
+    def __init__(self, path):
+        self.path = path
+        self._file = None
+
+    # --- reading ---
+    def __iter__(self):
+        """Records in file order; a torn last line (crash mid-write) is skipped."""
+        try:
+            f = open(self.path, "r", encoding="utf-8")
+        except FileNotFoundError:
+            return
+        with f:
+            for line in f:
+                if not line.endswith("\n"):
+                    break
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    continue
+
+    def keys(self):
+        """Set of (solver, config, secret, seed) already recorded."""
+        return {(r["solver"], r.get("config"), r["secret"], r["seed"]) for r in self}
+
+    # --- writing ---
+    def append(self, record):
+        if self._file is None:
+            self._repair()
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            self._file = open(self.path, "a", encoding="utf-8")
+        self._file.write(json.dumps(record) + "\n")
+        self._file.flush()
+
+    def _repair(self):
+        """Drop a torn last line left by a crash, so appends start on a fresh line."""
+        try:
+            with open(self.path, "rb+") as f:
+                data = f.read()
+                if data and not data.endswith(b"\n"):
+                    f.truncate(data.rfind(b"\n") + 1)
+        except FileNotFoundError:
+            pass
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # --- streaming aggregates ---
+    @staticmethod
+    def _labels(groups):
+        """
+        Display name of each (solver, config) group: the solver name, or
+        "solver [config]" when several configurations share that name.
+        """
+        configs = Counter(solver for solver, _ in groups)
+        return {(solver, config): solver if configs[solver] == 1 else f"{solver} [{config}]"
+                for solver, config in groups}
+
+    def summary(self):
+        """
+        {label: {"games", "wins", "win_rate", "avg_guesses", "move_ms_mean"}}
+        (file order), one entry per (solver, config), see _labels.
+        """
+        acc = defaultdict(lambda: {"games": 0, "wins": 0, "guesses": 0, "moves": 0, "ms": 0.0})
+        for r in self:
+            a = acc[r["solver"], r.get("config")]
+            a["games"] += 1
+            if r["win"]:
+                a["wins"] += 1
+                a["guesses"] += r["n_guesses"]
+            a["moves"] += len(r["move_ms"])
+            a["ms"] += sum(r["move_ms"])
+        labels = self._labels(acc)
+        return {
+            labels[group]: {
+                "games": a["games"],
+                "wins": a["wins"],
+                "win_rate": a["wins"] / a["games"],
+                "avg_guesses": a["guesses"] / a["wins"] if a["wins"] else 0.0,
+                "move_ms_mean": a["ms"] / a["moves"] if a["moves"] else 0.0,
+            }
+            for group, a in acc.items()
+        }
+
+    def distribution(self):
+        """{label: Counter(number of guesses, 0 = lost)} (labels as in summary())."""
+        counts = defaultdict(Counter)
+        for r in self:
+            counts[r["solver"], r.get("config")][r["n_guesses"]] += 1
+        labels = self._labels(counts)
+        return {labels[group]: counter for group, counter in counts.items()}
+
+    def summary_frame(self):
+        """summary() as the results.csv table (Solver, WinRate, AvgGuesses)."""
+        import pandas as pd
+        return pd.DataFrame([{"Solver": solver, "WinRate": s["win_rate"], "AvgGuesses": s["avg_guesses"]}
+                             for solver, s in self.summary().items()],
+                            columns=["Solver", "WinRate", "AvgGuesses"])
+
+    def distribution_frame(self):
+        """distribution() as the distribution.csv table (Solver, Guesses, Count; losses = "fail")."""
+        import pandas as pd
+        rows = [{"Solver": solver, "Guesses": str(n) if n else "fail", "Count": count}
+                for solver, counter in self.distribution().items()
+                for n, count in sorted(counter.items())]
+        return pd.DataFrame(rows, columns=["Solver", "Guesses", "Count"])
@@ -0,0 +1,145 @@
+import numpy as np
+
+from feedback import N_PATTERNS
+
+
+# ===============================
+#  Batched pattern histograms
+# ===============================
+# Upper bound on the (guesses x candidates) block materialized at once
+_BLOCK_CELLS = 1 << 22
+
+
+def pattern_histograms(table, candidates, guesses=None):
+    """
+    Feedback histogram of every guess over the remaining candidates.
+    Returns an int array of shape (len(guesses), 243) where row i counts,
+    for guess guesses[i], how many candidates produce each pattern.
+    guesses defaults to the candidates themselves.
+    """
+    candidates = np.asarray(candidates)
+    guesses = candidates if guesses is None else np.asarray(guesses)
+    counts = np.empty((len(guesses), N_PATTERNS), dtype=np.int64)
+    if len(candidates) == 0:
+        counts[:] = 0
+        return counts
+
+    block = max(1, _BLOCK_CELLS // len(candidates))
+    for start in range(0, len(guesses), block):
+        rows = guesses[start:start + block]
+        codes = table.matrix[np.ix_(rows, candidates)].astype(np.int64)
+        # Offset each row into its own 243-bin range, then one bincount
+        codes += (np.arange(len(rows)) * N_PATTERNS)[:, None]
+        counts[start:start + len(rows)] = np.bincount(
+            codes.ravel(), minlength=len(rows) * N_PATTERNS).reshape(len(rows), N_PATTERNS)
+    return counts
+
+
+def entropy_scores(table, candidates, guesses=None):
+    """
+    Shannon entropy (bits) of the feedback distribution of each guess,
+    assuming the secret is uniform over 'candidates'.
+    """
+    counts = pattern_histograms(table, candidates, guesses)
+    total = max(len(candidates), 1)
+    p = counts / total
+    with np.errstate(divide="ignore", invalid="ignore"):
+        terms = np.where(counts > 0, p * np.log2(p), 0.0)
+    return -terms.sum(axis=1)
+
+
+def entropy_scores_many(table, candidate_sets):
+    """
+    entropy_scores() of several positions at once (each set scored against
+    itself, as for legal moves): the histograms of all positions come from
+    shared bincounts instead of one call per position.
+    Returns a list of score arrays, one per candidate set.
+    """
+    sets = [np.asarray(c) for c in candidate_sets]
+    scores = [None] * len(sets)
+    pending, cells = [], 0
+
+    def flush():
+        if not pending:
+            return
+        rows = sum(len(sets[i]) for i in pending)
+        codes, offset = [], 0
+        for i in pending:
+            c = sets[i]
+            block = table.matrix[np.ix_(c, c)].astype(np.int64)
+            block += ((offset + np.arange(len(c))) * N_PATTERNS)[:, None]
+            codes.append(block.ravel())
+            offset += len(c)
+        counts = np.bincount(np.concatenate(codes), minlength=rows * N_PATTERNS)
+        counts = counts.reshape(rows, N_PATTERNS)
+        offset = 0
+        for i in pending:
+            n = len(sets[i])
+            p = counts[offset:offset + n] / n
+            with np.errstate(divide="ignore", invalid="ignore"):
+                scores[i] = -np.where(p > 0, p * np.log2(p), 0.0).sum(axis=1)
+            offset += n
+        pending.clear()
+
+    for i, c in enumerate(sets):
+        if len(c) == 0:
+            scores[i] = np.zeros(0)
+            continue
+        if cells + len(c) ** 2 > _BLOCK_CELLS:
+            flush()
+            cells = 0
+        pending.append(i)
+        cells += len(c) ** 2
+    flush()
+    return scores
+
+
+_ENTROPY_CACHE = {}
+_ENTROPY_CACHE_SIZE = 256
+# Candidate sets smaller than this are cheaper to score than to hash
+_ENTROPY_CACHE_MIN = 64
+
+
+def state_entropies(state, wordlist):
+    """
+    Entropy of each legal move of 'state' (same order as legal_moves).
+    Large candidate sets (e.g. the opening position, scored by every
+    playout) are memoized per table.
+    """
+    state.legal_moves(wordlist)
+    candidates = state.candidates
+    if len(candidates) < _ENTROPY_CACHE_MIN:
+        return entropy_scores(state.table, candidates)
+    key = (state.table, candidates.tobytes())
+    scores = _ENTROPY_CACHE.get(key)
+    if scores is None:
+        if len(_ENTROPY_CACHE) >= _ENTROPY_CACHE_SIZE:
+            _ENTROPY_CACHE.clear()
+        scores = _ENTROPY_CACHE[key] = entropy_scores(state.table, candidates)
+    return scores
+
+
+# ===============================
+#  Move priors
+# ===============================
+def letter_frequency_scores(moves):
+    """Sum over the distinct letters of each move of their frequency in 'moves'."""
+    counts = {}
+    for word in moves:
+        for c in word:
+            counts[c] = counts.get(c, 0) + 1
+    return np.array([sum(counts[c] for c in set(word)) for word in moves], dtype=float)
+
+
+def move_priors(state, wordlist, prior):
+    """
+    Prior score of each legal move of 'state' (higher is better).
+    prior: "entropy", "frequency" or a callable (state, wordlist) -> scores.
+    """
+    if prior == "entropy":
+        return state_entropies(state, wordlist)
+    if prior == "frequency":
+        return letter_frequency_scores(state.legal_moves(wordlist))
+    if callable(prior):
+        return np.asarray(prior(state, wordlist), dtype=float)
+    raise ValueError(f"Unknown prior: {prior}")
@@ -0,0 +1,346 @@
+"""
+Local solving service: JSON lines over stdin/stdout or a unix socket.
+
+Request  : {"id": 1, "history": [["crane", "BYBGB"], ...], "solver": "entropy"}
+           feedbacks are 'G'/'Y'/'B' strings or pattern codes;
+           {"id": 2, "op": "stats"} returns the service metrics.
+Response : {"id": 1, "move": "slate"} or {"id": 1, "error": "..."}
+
+    python service.py                       # stdin/stdout
+    python service.py --socket /tmp/wordle.sock --workers 4
+"""
+import argparse
+import asyncio
+import json
+import sys
+import time
+import zlib
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+import experiments
+from feedback import table_for
+from scoring import entropy_scores_many, state_entropies
+from solvers import SOLVERS
+from utils import derive_seed, load_wordlist, seed_all
+from wordle import WordleState, parse_history, state_from_history
+
+
+# Solvers computed inline for a whole batch at once (the others run off the
+# event loop); "entropy" is batched with scoring.entropy_scores_many
+BATCHED_SOLVERS = ("entropy",)
+
+
+def _worker_move(solver, history, seed):
+    """Search run in a process of experiments.make_executor."""
+    wordlist = experiments._WORKER_WORDLIST
+    state = state_from_history(wordlist, history, seed)
+    seed_all(seed)
+    return solver(state, wordlist)
+
+
+# ===============================
+#  Service
+# ===============================
+class MoveService:
+    """
+    Answers "next move for this history" requests from many concurrent games.
+    Requests are queued and taken in micro-batches (up to max_batch, waiting
+    at most max_wait_ms for the batch to fill). Within a batch, identical
+    positions are computed once, "entropy" requests share one vectorized
+    scoring pass, and search solvers run on a process pool (n_workers > 0)
+    or one at a time on a background thread. Answers are deterministic for a
+    given seed and cached (LRU).
+    """
+
+    def __init__(self, wordlist, n_workers=0, max_batch=64, max_wait_ms=2.0,
+                 cache_size=10_000, seed=0, solvers=None):
+        self.wordlist = wordlist
+        self.n_workers = n_workers
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000.0
+        self.cache_size = cache_size
+        self.seed = seed
+        self.solvers = dict(SOLVERS if solvers is None else solvers)
+        self.cache = OrderedDict()
+        self._pending = {}
+        self.executor = None
+        self._queue = None
+        self._task = None
+        # metrics
+        self.requests = 0
+        self.cache_hits = 0
+        self.shared = 0
+        self.max_queue = 0
+        self.batch_sizes = deque(maxlen=10_000)
+        self.latencies = deque(maxlen=10_000)
+
+    async def start(self):
+        # Warm the feedback table and the opening entropies
+        opening = WordleState(None)
+        state_entropies(opening, self.wordlist)
+        if self.n_workers > 0:
+            self.executor = experiments.make_executor(self.wordlist, self.n_workers)
+        else:
+            # Searches seed the global RNGs: one at a time keeps them deterministic
+            self.executor = ThreadPoolExecutor(max_workers=1)
+        self._queue = asyncio.Queue()
+        self._task = asyncio.create_task(self._batches())
+        return self
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self.executor is not None:
+            self.executor.shutdown()
+            self.executor = None
+
+    async def __aenter__(self):
+        return await self.start()
+
+    async def __aexit__(self, *exc):
+        await self.stop()
+
+    async def next_move(self, history, solver="entropy"):
+        """Move for the position reached by 'history' (see parse_history)."""
+        if solver not in self.solvers:
+            raise ValueError(f"unknown solver {solver!r}")
+        history = parse_history(history)
+        start = time.perf_counter()
+        self.requests += 1
+        key = (solver, history)
+        if key in self.cache:
+            self.cache.move_to_end(key)
+            self.cache_hits += 1
+            move = self.cache[key]
+        else:
+            future = asyncio.get_running_loop().create_future()
+            self._queue.put_nowait((key, future))
+            self.max_queue = max(self.max_queue, self._queue.qsize())
+            move = await future
+        self.latencies.append(time.perf_counter() - start)
+        return move
+
+    def _seed(self, key):
+        return derive_seed(self.seed, zlib.crc32(repr(key).encode("utf-8")))
+
+    def _remember(self, key, move):
+        self.cache[key] = move
+        if len(self.cache) > self.cache_size:
+            self.cache.popitem(last=False)
+
+    # --- batching ---
+    async def _batches(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_wait
+            while len(batch) < self.max_batch:
+                if self._queue.empty():
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                    except asyncio.TimeoutError:
+                        break
+                else:
+                    batch.append(self._queue.get_nowait())
+            self.batch_sizes.append(len(batch))
+            self._dispatch(batch)
+
+    def _dispatch(self, batch):
+        new = []
+        for key, future in batch:
+            if key in self._pending:
+                # same position already queued or running: share its answer
+                self._pending[key].append(future)
+                self.shared += 1
+            else:
+                self._pending[key] = [future]
+                new.append(key)
+
+        # A failing request is answered with its error: the batch loop goes on
+        entropy_states = []
+        for key in new:
+            solver, history = key
+            try:
+                if key in self.cache:
+                    self._resolve(key, self.cache[key])
+                elif solver in BATCHED_SOLVERS:
+                    entropy_states.append((key, state_from_history(self.wordlist, history, self._seed(key))))
+                else:
+                    self._submit(key)
+            except Exception as e:
+                self._resolve(key, error=e)
+
+        if entropy_states:
+            try:
+                scores = entropy_scores_many(table_for(self.wordlist),
+                                             [state.candidates for _, state in entropy_states])
+                moves = [self.wordlist[int(state.candidates[int(np.argmax(s))])]
+                         for (_, state), s in zip(entropy_states, scores)]
+            except Exception as e:
+                for key, _ in entropy_states:
+                    self._resolve(key, error=e)
+            else:
+                for (key, _), move in zip(entropy_states, moves):
+                    self._resolve(key, move)
+
+    def _resolve(self, key, move=None, error=None):
+        if error is None:
+            self._remember(key, move)
+        for future in self._pending.pop(key):
+            if future.done():
+                continue
+            if error is None:
+                future.set_result(move)
+            else:
+                future.set_exception(error)
+
+    def _submit(self, key):
+        solver, history = key
+        loop = asyncio.get_running_loop()
+        move = _worker_move if self.n_workers > 0 else self._local_move
+        future = loop.run_in_executor(self.executor, move, self.solvers[solver], history, self._seed(key))
+
+        def done(f):
+            if f.cancelled():
+                self._resolve(key, error=asyncio.CancelledError())
+            elif f.exception() is not None:
+                self._resolve(key, error=f.exception())
+            else:
+                self._resolve(key, f.result())
+
+        future.add_done_callback(done)
+
+    def _local_move(self, solver, history, seed):
+        state = state_from_history(self.wordlist, history, seed)
+        seed_all(seed)
+        return solver(state, self.wordlist)
+
+    # --- metrics ---
+    def stats(self):
+        latencies = np.array(self.latencies) * 1000.0
+        sizes = np.array(self.batch_sizes)
+        percentiles = {f"latency_p{p}_ms": float(np.percentile(latencies, p)) if len(latencies) else 0.0
+                       for p in (50, 95, 99)}
+        return {
+            "requests": self.requests,
+            "cache_hits": self.cache_hits,
+            "shared": self.shared,
+            "queue_depth": self._queue.qsize() if self._queue is not None else 0,
+            "max_queue_depth": self.max_queue,
+            "batches": len(sizes),
+            "batch_size_mean": float(sizes.mean()) if len(sizes) else 0.0,
+            "batch_size_max": int(sizes.max()) if len(sizes) else 0,
+            **percentiles,
+        }
+
+
+# ===============================
+#  JSON-lines transport
+# ===============================
+async def handle(service, line):
+    """Response (a dict) to one request line."""
+    try:
+        request = json.loads(line)
+    except ValueError:
+        return {"error": "invalid JSON"}
+    if not isinstance(request, dict):
+        return {"error": "requests must be JSON objects"}
+    response = {"id": request.get("id")}
+    try:
+        if request.get("op", "move") == "stats":
+            response["stats"] = service.stats()
+        elif request.get("op", "move") == "move":
+            response["move"] = await service.next_move(request.get("history", []),
+                                                       request.get("solver", "entropy"))
+        else:
+            response["error"] = f"unknown op {request['op']!r}"
+    except Exception as e:
+        response["error"] = str(e)
+    return response
+
+
+async def _serve_lines(service, reader, write):
+    """Answer each line concurrently (responses in completion order, matched by id)."""
+    pending = set()
+
+    async def answer(line):
+        write(json.dumps(await handle(service, line)) + "\n")
+
+    while True:
+        line = await reader.readline()
+        if not line:
+            break
+        if line.strip():
+            task = asyncio.create_task(answer(line))
+            pending.add(task)
+            task.add_done_callback(pending.discard)
+    if pending:
+        await asyncio.gather(*pending)
+
+
+async def serve_stdio(service):
+    loop = asyncio.get_running_loop()
+    reader = asyncio.StreamReader()
+    await loop.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(reader), sys.stdin)
+
+    def write(text):
+        sys.stdout.write(text)
+        sys.stdout.flush()
+
+    await _serve_lines(service, reader, write)
+
+
+async def serve_socket(service, path):
+    async def client(reader, writer):
+        try:
+            await _serve_lines(service, reader, lambda text: writer.write(text.encode("utf-8")))
+            await writer.drain()
+        finally:
+            writer.close()
+
+    server = await asyncio.start_unix_server(client, path=path)
+    async with server:
+        await server.serve_forever()
+
+
+async def _main(args):
+    wordlist = load_wordlist(args.wordlist)
+    async with MoveService(wordlist, n_workers=args.workers, max_batch=args.max_batch,
+                           max_wait_ms=args.max_wait_ms, seed=args.seed) as service:
+        try:
+            if args.socket:
+                await serve_socket(service, args.socket)
+            else:
+                await serve_stdio(service)
+        finally:
+            print(json.dumps(service.stats()), file=sys.stderr)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Wordle next-move service (JSON lines)")
+    parser.add_argument("--wordlist", default="wordlist.txt")
+    parser.add_argument("--socket", help="unix socket path (default: stdin/stdout)")
+    parser.add_argument("--workers", type=int, default=0, help="process pool size for searches")
+    parser.add_argument("--max-batch", type=int, default=64)
+    parser.add_argument("--max-wait-ms", type=float, default=2.0)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(_main(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,16 @@
+import atexit
 import math
 import random
+import time
 from collections import defaultdict
+from functools import partial
+import numpy as np
+import instrumentation
+from feedback import table_for
 from wordle import WordleState
-from playouts import random_playout 
+from utils import seed_all, solver_key
+from playouts import random_playout, run_playouts
+from scoring import move_priors, state_entropies
 
 
 # ===============================
@@ -14,26 +22,78 @@ def random_solver(state: WordleState, wordlist):
     return random.choice(moves)
 
 
+# ===============================
+#  Greedy: Entropy Solver
+# ===============================
+def entropy_solver(state: WordleState, wordlist):
+    """Choose the legal move with the highest information gain (no search)."""
+    moves = state.legal_moves(wordlist)
+    return moves[int(np.argmax(state_entropies(state, wordlist)))]
+
+
+# ===============================
+#  Time budgets (anytime search)
+# ===============================
+def make_deadline(time_budget_ms):
+    """perf_counter() deadline for a budget in milliseconds (None = no budget)."""
+    if time_budget_ms is None:
+        return None
+    return time.perf_counter() + time_budget_ms / 1000.0
+
+
+def expired(deadline):
+    return deadline is not None and time.perf_counter() >= deadline
+
+
 # ===============================
 #  Flat Monte Carlo (no tree)
 # ===============================
-def flat_mc(state: WordleState, wordlist, n_playouts=100, playout_fn=None):
+def flat_mc(state: WordleState, wordlist, n_playouts=100, playout_fn=None,
+            time_budget_ms=None, info=None, batch_size=1):
     """
     Flat Monte Carlo Search:
     - Run many playouts for each possible move
     - Return the move with highest win rate
+    Playouts are spread round-robin over the moves, batch_size at a time
+    (vectorized for random playouts), so with time_budget_ms the search can
+    stop at the deadline (after at least one batch) with comparable
+    estimates. n_playouts=None means no limit per move (time_budget_ms is
+    then required).
+    info["iterations"] receives the number of playouts run.
     """
-    best_move, best_score = None, -float("inf")
+    if n_playouts is None and time_budget_ms is None:
+        raise ValueError("flat_mc needs n_playouts or time_budget_ms")
+    deadline = make_deadline(time_budget_ms)
     moves = state.legal_moves(wordlist)
+    # Playouts clone their input: each child state is built once, on first
+    # use, so a short budget is not spent building children it never plays
+    next_states = [None] * len(moves)
+    score_sums = [0.0] * len(moves)
+    counts = [0] * len(moves)
+    iterations = 0
+
+    # After each full round every move has the same number of playouts
+    while (n_playouts is None or counts[0] < n_playouts) and not (iterations and expired(deadline)):
+        for i, move in enumerate(moves):
+            if next_states[i] is None:
+                next_states[i] = state.play_into(move, state.clone())
+            k = batch_size if n_playouts is None else min(batch_size, n_playouts - counts[i])
+            score_sums[i] += float(run_playouts(next_states[i], wordlist, playout_fn, k).sum())
+            counts[i] += k
+            iterations += k
+            if expired(deadline):
+                break
+
+    if info is not None:
+        info["iterations"] = iterations
+    if instrumentation.TRACER is not None:
+        instrumentation.TRACER.search(iterations)
 
-    for move in moves:
-        score_sum = 0
-        for _ in range(n_playouts):
-            next_state = state.clone()
-            next_state.play(move)
-            score_sum += playout_fn(next_state, wordlist) if playout_fn else random_playout(next_state, wordlist)
-
-        avg_score = score_sum / n_playouts
+    best_move, best_score = None, -float("inf")
+    for move, score_sum, count in zip(moves, score_sums, counts):
+        if count == 0:
+            continue
+        avg_score = score_sum / count
         if avg_score > best_score:
             best_score, best_move = avg_score, move
 
@@ -41,196 +101,513 @@ def flat_mc(state: WordleState, wordlist, n_playouts=100, playout_fn=None):
 
 
 # ===============================
-#  UCT (Tree Search)
+#  UCT core (shared by UCT, RAVE, GRAVE)
 # ===============================
-def uct_search(state: WordleState, wordlist, n_iter=100, playout_fn=None, c=1.41):
+def simulate(node: WordleState, wordlist, playout_fn=None, n_playouts=1):
     """
-    Standard UCT Search.
-    Builds a tree with UCB1 selection, expansion, simulation, backpropagation.
+    Sum of rewards of n_playouts playouts from node (leaf parallelization),
+    run as one vectorized batch when the playout supports it.
     """
-    Q = defaultdict(float)
-    N = defaultdict(int)
-    N_state = defaultdict(int)
-    children = dict()
+    return float(run_playouts(node, wordlist, playout_fn, n_playouts).sum())
 
-    def policy(state):
-        if state in children:
-            return max(children[state],
-                       key=lambda a: Q[(state, a)] / (N[(state, a)] + 1e-9) +
-                                     c * math.sqrt(math.log(N_state[state] + 1) / (N[(state, a)] + 1e-9)))
-        return None
 
-    for _ in range(n_iter):
-        path, node = [], state.clone()
+class Node:
+    """
+    Expanded state of the search tree. Per-child statistics live in
+    contiguous arrays aligned with 'moves' (slot i <-> moves[i]).
+    - move_ids : table indices of the moves (the state's candidates)
+    - children : node id of each child, -1 while not linked
+    - visits   : N(state)
+    - stamp    : tick of the last selection through the node (LRU eviction)
+    """
 
-        # SELECTION
-        while node in children and not node.is_terminal():
-            a = policy(node)
-            path.append((node, a))
-            node = node.clone()
-            node.play(a)
+    __slots__ = ("moves", "move_ids", "N", "Q", "N_rave", "Q_rave", "children", "visits",
+                 "stamp")
 
-        # EXPANSION
-        if not node.is_terminal():
-            children[node] = node.legal_moves(wordlist)
+    def __init__(self, moves, move_ids):
+        n = len(moves)
+        self.moves = moves
+        self.move_ids = move_ids
+        self.N = np.zeros(n)
+        self.Q = np.zeros(n)
+        self.N_rave = np.zeros(n)
+        self.Q_rave = np.zeros(n)
+        self.children = np.full(n, -1, dtype=np.int64)
+        self.visits = 0
+        self.stamp = 0
 
-        # SIMULATION
-        reward = (playout_fn(node, wordlist) if playout_fn else random_playout(node, wordlist))
+    def nbytes(self):
+        return (self.N.nbytes + self.Q.nbytes + self.N_rave.nbytes + self.Q_rave.nbytes
+                + self.children.nbytes)
 
-        # BACKPROPAGATION
-        for (s, a) in path:
-            N[(s, a)] += 1
-            Q[(s, a)] += reward
-            N_state[s] += 1
 
-    legal = state.legal_moves(wordlist)
-    return max(legal, key=lambda a: Q[(state, a)] / (N[(state, a)] + 1e-9))
+class SearchTree:
+    """
+    Node pool of a UCT search. Nodes are stored in a list and referenced by
+    id; 'index' is the transposition table (WordleState.key() -> node id),
+    so every iteration walks down the same tree and transpositions share
+    their statistics.
+    With max_nodes, the pool is bounded: once full, the least valuable
+    nodes ('visits': least visited, 'lru': least recently selected) are
+    evicted together with the subtrees that become unreachable.
+    """
 
+    def __init__(self, max_nodes=None, eviction="visits", evict_fraction=0.1):
+        if eviction not in ("visits", "lru"):
+            raise ValueError(f"Unknown eviction policy: {eviction}")
+        self.nodes = []
+        self.index = {}
+        self.max_nodes = max_nodes
+        self.eviction = eviction
+        self.evict_fraction = evict_fraction
+        self.evicted = 0
+        self.tick = 0
+
+    def __len__(self):
+        return len(self.nodes)
+
+    def nbytes(self):
+        """Approximate size of the per-child statistics arrays."""
+        return sum(node.nbytes() for node in self.nodes)
+
+    def get(self, key):
+        return self.index.get(key)
+
+    def add(self, key, state, wordlist, prior=None):
+        """
+        Expand 'state' into a new node and return its id.
+        With a prior, the moves are stored best-prior first.
+        """
+        moves, move_ids = state.legal_moves(wordlist), state.candidates
+        if prior is not None:
+            order = np.argsort(-move_priors(state, wordlist, prior), kind="stable")
+            moves, move_ids = [moves[i] for i in order], move_ids[order]
+        node = Node(moves, move_ids)
+        node.stamp = self.tick  # a new node counts as just used (LRU eviction)
+        self.nodes.append(node)
+        self.index[key] = len(self.nodes) - 1
+        return len(self.nodes) - 1
+
+    def visits(self, key):
+        node_id = self.index.get(key)
+        return 0 if node_id is None else self.nodes[node_id].visits
+
+    def full(self):
+        return self.max_nodes is not None and len(self.nodes) >= self.max_nodes
+
+    def _compact(self, root_id, removed=()):
+        """Keep the nodes reachable from root_id without crossing 'removed'."""
+        order, seen, stack = [], {root_id, *removed}, [root_id]
+        while stack:
+            node_id = stack.pop()
+            order.append(node_id)
+            for child in self.nodes[node_id].children:
+                if child >= 0 and child not in seen:
+                    seen.add(int(child))
+                    stack.append(int(child))
+
+        remap = np.full(len(self.nodes) + 1, -1, dtype=np.int64)
+        remap[order] = np.arange(len(order))
+        self.index = {key: int(remap[i]) for key, i in self.index.items() if remap[i] >= 0}
+        self.nodes = [self.nodes[i] for i in order]
+        for node in self.nodes:
+            # remap[-1] is the extra -1 slot: unlinked children stay -1
+            node.children = remap[node.children]
+
+    def promote(self, root):
+        """Keep only the subtree reachable from 'root' (the new root key)."""
+        root_id = self.index.get(root)
+        if root_id is None:
+            self.nodes, self.index = [], {}
+            return
+        self._compact(root_id)
+
+    def evict(self, root):
+        """
+        Free at least evict_fraction of max_nodes: drop the lowest-ranked
+        nodes (never the root) and everything only reachable through them.
+        """
+        root_id = self.index.get(root)
+        if root_id is None:
+            return
+        before = len(self.nodes)
+        n_evict = max(1, int(self.max_nodes * self.evict_fraction))
+        if self.eviction == "visits":
+            scores = np.array([node.visits for node in self.nodes], dtype=float)
+        else:
+            scores = np.array([node.stamp for node in self.nodes], dtype=float)
+        scores[root_id] = np.inf
+        victims = np.argsort(scores, kind="stable")[:n_evict]
+        self._compact(root_id, removed={int(v) for v in victims if v != root_id})
+        self.evicted += before - len(self.nodes)
 
-# ===============================
-#  UCT + RAVE
-# ===============================
-def uct_rave_search(state: WordleState, wordlist, n_iter=100, playout_fn=None, c=1.41):
+
+def _uct_core(state, wordlist, n_iter, playout_fn, c, beta=None, leaf_playouts=1,
+              time_budget_ms=None, info=None, tree=None, max_nodes=None,
+              prior=None, pw_c=1.0, pw_alpha=0.5):
     """
-    UCT with RAVE (Rapid Action Value Estimation).
-    Uses statistics of actions seen in simulations (not only direct descendants).
+    Generic UCT loop. With beta(n, n_rave) the value of each action mixes
+    its own mean with its RAVE mean (AMAF over the actions of the path).
+    Each leaf is evaluated by leaf_playouts playouts counted as as many visits.
+    Stops after n_iter iterations or once time_budget_ms has elapsed,
+    whichever comes first (at least one iteration always runs); n_iter=None
+    means no limit and then requires time_budget_ms.
+    Statistics accumulate in 'tree' (a fresh SearchTree by default); UCB
+    scores of all children are computed at once on the node arrays.
+    max_nodes bounds the tree (see SearchTree).
+    Progressive widening (when 'prior' is set, see scoring.move_priors):
+    moves are ranked once per node by the prior and only the best
+    ceil(pw_c * (N(state) + 1) ** pw_alpha) of them compete in selection.
+    If 'info' is a dict it receives the number of iterations run, the tree
+    size and memory, the node creation rate, the number of evicted nodes
+    and the root statistics {move: (N, Q)}.
     """
-    Q, N, N_state, children = defaultdict(float), defaultdict(int), defaultdict(int), dict()
-    Q_rave, N_rave = defaultdict(float), defaultdict(int)
-
-    def beta(n):
-        k = 300
-        return k / (n + k)
-
-    def policy(state):
-        if state in children:
-            def ucb1_rave(a):
-                q = Q[(state, a)] / (N[(state, a)] + 1e-9)
-                q_rave = Q_rave[(state, a)] / (N_rave[(state, a)] + 1e-9)
-                b = beta(N[(state, a)])
-                combined_q = (1 - b) * q + b * q_rave
-                exploration = c * math.sqrt(math.log(N_state[state] + 1) / (N[(state, a)] + 1e-9))
-                return combined_q + exploration
-            return max(children[state], key=ucb1_rave)
-        return None
-
-    for _ in range(n_iter):
+    start = time.perf_counter()
+    if n_iter is None and time_budget_ms is None:
+        raise ValueError("UCT search needs n_iter or time_budget_ms")
+    deadline = make_deadline(time_budget_ms)
+    tree = SearchTree() if tree is None else tree
+    if max_nodes is not None:
+        tree.max_nodes = max_nodes
+    initial_evicted = tree.evicted
+    created = 0
+
+    def policy(node):
+        width = len(node.moves)
+        if prior is not None:
+            width = min(width, math.ceil(pw_c * (node.visits + 1) ** pw_alpha))
+        n = node.N[:width]
+        q = node.Q[:width] / (n + 1e-9)
+        if beta is not None:
+            n_rave = node.N_rave[:width]
+            q_rave = node.Q_rave[:width] / (n_rave + 1e-9)
+            b = beta(n, n_rave)
+            q = (1 - b) * q + b * q_rave
+        return int(np.argmax(q + c * np.sqrt(math.log(node.visits + 1) / (n + 1e-9))))
+
+    state.legal_moves(wordlist)
+    root = state.key()
+    # Phase timing only when a tracer is active
+    tracer = instrumentation.TRACER
+    clock = time.perf_counter
+
+    iterations = 0
+    while (n_iter is None or iterations < n_iter) and not (iterations and expired(deadline)):
+        iterations += 1
+        if tree.full():
+            tree.evict(root)
+        nodes = tree.nodes
+        tree.tick += 1
         path, node = [], state.clone()
+        node_id = tree.get(root)
         actions_played = []
+        if tracer is not None:
+            t0 = clock()
 
         # SELECTION
-        while node in children and not node.is_terminal():
-            a = policy(node)
-            path.append((node, a))
-            actions_played.append(a)
+        while node_id is not None and not node.is_terminal():
+            parent = nodes[node_id]
+            parent.stamp = tree.tick
+            slot = policy(parent)
+            path.append((parent, slot))
+            actions_played.append(parent.move_ids[slot])
             node = node.clone()
-            node.play(a)
+            node.play(parent.moves[slot])
+            node_id = int(parent.children[slot])
+            if node_id < 0:
+                node_id = tree.get(node.key())
+                if node_id is not None:
+                    parent.children[slot] = node_id
+
+        if tracer is not None:
+            t1 = clock()
+            tracer.phase("selection", t1 - t0)
 
         # EXPANSION
         if not node.is_terminal():
-            children[node] = node.legal_moves(wordlist)
+            node_id = tree.add(node.key(), node, wordlist, prior)
+            created += 1
+            if path:
+                parent, slot = path[-1]
+                parent.children[slot] = node_id
+        if tracer is not None:
+            t2 = clock()
+            tracer.phase("expansion", t2 - t1)
 
         # SIMULATION
-        reward = (playout_fn(node, wordlist) if playout_fn else random_playout(node, wordlist))
+        reward = simulate(node, wordlist, playout_fn, leaf_playouts)
+        if tracer is not None:
+            t3 = clock()
+            tracer.phase("simulation", t3 - t2)
 
         # BACKPROPAGATION
-        for (s, a) in path:
-            N[(s, a)] += 1
-            Q[(s, a)] += reward
-            N_state[s] += 1
-            for rave_a in actions_played:
-                N_rave[(s, rave_a)] += 1
-                Q_rave[(s, rave_a)] += reward
+        if beta is not None and path:
+            played = np.array(actions_played)
+        for parent, slot in path:
+            parent.N[slot] += leaf_playouts
+            parent.Q[slot] += reward
+            parent.visits += leaf_playouts
+            if beta is not None:
+                mask = np.isin(parent.move_ids, played)
+                parent.N_rave[mask] += leaf_playouts
+                parent.Q_rave[mask] += reward
+        if tracer is not None:
+            tracer.phase("backpropagation", clock() - t3)
+
+    if tracer is not None:
+        tracer.search(iterations, len(tree))
+    root_node = tree.nodes[tree.get(root)]
+    if info is not None:
+        elapsed = time.perf_counter() - start
+        info["iterations"] = iterations
+        info["nodes"] = len(tree)
+        info["tree_bytes"] = tree.nbytes()
+        info["nodes_per_sec"] = created / elapsed if elapsed > 0 else 0.0
+        info["evicted"] = tree.evicted - initial_evicted
+        info["root"] = {a: (float(n), float(q))
+                        for a, n, q in zip(root_node.moves, root_node.N, root_node.Q)}
+    return root_node.moves[int(np.argmax(root_node.Q / (root_node.N + 1e-9)))]
 
-    legal = state.legal_moves(wordlist)
-    return max(legal, key=lambda a: Q[(state, a)] / (N[(state, a)] + 1e-9))
+
+# ===============================
+#  UCT (Tree Search)
+# ===============================
+def uct_search(state: WordleState, wordlist, n_iter=100, playout_fn=None, c=1.41,
+               leaf_playouts=1, time_budget_ms=None, info=None, tree=None,
+               max_nodes=None, prior=None, pw_c=1.0, pw_alpha=0.5):
+    """
+    Standard UCT Search.
+    Builds a tree with UCB1 selection, expansion, simulation, backpropagation.
+    With time_budget_ms the search is anytime: it returns the best move found
+    when the budget expires (n_iter stays an upper bound; pass None to lift it).
+    With max_nodes the tree never holds more nodes than that (evicting the
+    least visited subtrees).
+    With prior ("entropy", "frequency" or a callable) children are added by
+    progressive widening, best prior first (see _uct_core).
+    """
+    return _uct_core(state, wordlist, n_iter, playout_fn, c,
+                     leaf_playouts=leaf_playouts, time_budget_ms=time_budget_ms, info=info,
+                     tree=tree, max_nodes=max_nodes, prior=prior, pw_c=pw_c, pw_alpha=pw_alpha)
+
+
+# ===============================
+#  UCT + RAVE
+# ===============================
+def uct_rave_search(state: WordleState, wordlist, n_iter=100, playout_fn=None, c=1.41,
+                    leaf_playouts=1, time_budget_ms=None, info=None, tree=None,
+                    max_nodes=None, prior=None, pw_c=1.0, pw_alpha=0.5, rave_k=300):
+    """
+    UCT with RAVE (Rapid Action Value Estimation).
+    Uses statistics of actions seen in simulations (not only direct descendants).
+    rave_k: visit count at which RAVE and UCT estimates weigh equally.
+    """
+    def beta(n, n_rave):
+        return rave_k / (n + rave_k)
+
+    return _uct_core(state, wordlist, n_iter, playout_fn, c, beta=beta,
+                     leaf_playouts=leaf_playouts, time_budget_ms=time_budget_ms, info=info,
+                     tree=tree, max_nodes=max_nodes, prior=prior, pw_c=pw_c, pw_alpha=pw_alpha)
 
 
 # ===============================
 #  UCT + GRAVE
 # ===============================
-def uct_grave_search(state: WordleState, wordlist, n_iter=100, playout_fn=None, c=1.41):
+def uct_grave_search(state: WordleState, wordlist, n_iter=100, playout_fn=None, c=1.41,
+                     leaf_playouts=1, time_budget_ms=None, info=None, tree=None,
+                     max_nodes=None, prior=None, pw_c=1.0, pw_alpha=0.5):
     """
     UCT with GRAVE (Generalized RAVE).
     Reduces RAVE bias when moves are not symmetric.
     """
-    Q, N, N_state, children = defaultdict(float), defaultdict(int), defaultdict(int), dict()
-    Q_rave, N_rave = defaultdict(float), defaultdict(int)
-
     def beta(n, n_rave):
         return n_rave / (n + n_rave + 1e-9)
 
-    def policy(state):
-        if state in children:
-            def ucb1_grave(a):
-                q = Q[(state, a)] / (N[(state, a)] + 1e-9)
-                q_rave = Q_rave[(state, a)] / (N_rave[(state, a)] + 1e-9)
-                b = beta(N[(state, a)], N_rave[(state, a)])
-                combined_q = (1 - b) * q + b * q_rave
-                exploration = c * math.sqrt(math.log(N_state[state] + 1) / (N[(state, a)] + 1e-9))
-                return combined_q + exploration
-            return max(children[state], key=ucb1_grave)
-        return None
+    return _uct_core(state, wordlist, n_iter, playout_fn, c, beta=beta,
+                     leaf_playouts=leaf_playouts, time_budget_ms=time_budget_ms, info=info,
+                     tree=tree, max_nodes=max_nodes, prior=prior, pw_c=pw_c, pw_alpha=pw_alpha)
 
-    for _ in range(n_iter):
-        path, node = [], state.clone()
-        actions_played = []
 
-        # SELECTION
-        while node in children and not node.is_terminal():
-            a = policy(node)
-            path.append((node, a))
-            actions_played.append(a)
-            node = node.clone()
-            node.play(a)
+# ===============================
+#  Subtree reuse across moves
+# ===============================
+class UCTSearch:
+    """
+    Stateful solver keeping its tree between the moves of a game.
+    After a guess and its feedback, the child subtree matching the new
+    state becomes the root and the search continues from its statistics.
+    search: uct_search, uct_rave_search or uct_grave_search (with **kwargs).
+    A state that does not continue the previous one (new game) resets it.
+    """
 
-        # EXPANSION
-        if not node.is_terminal():
-            children[node] = node.legal_moves(wordlist)
+    def __init__(self, search=uct_search, **kwargs):
+        self.search = search
+        self.kwargs = kwargs
+        self.reset()
+
+    def reset(self):
+        self.tree = SearchTree()
+        self._game = None
+
+    def _continues(self, state, wordlist):
+        if self._game is None:
+            return False
+        secret, history, previous_wordlist = self._game
+        return (state.secret == secret and wordlist is previous_wordlist
+                and len(state.history) > len(history)
+                and state.history[:len(history)] == history)
+
+    def __call__(self, state: WordleState, wordlist, info=None):
+        if self._continues(state, wordlist):
+            state.legal_moves(wordlist)
+            self.tree.promote(state.key())
+        else:
+            self.tree = SearchTree()
+        self._game = (state.secret, state.history, wordlist)
 
-        # SIMULATION
-        reward = (playout_fn(node, wordlist) if playout_fn else random_playout(node, wordlist))
+        if info is not None:
+            state.legal_moves(wordlist)
+            info["reused_visits"] = self.tree.visits(state.key())
+        return self.search(state, wordlist, info=info, tree=self.tree, **self.kwargs)
 
-        # BACKPROPAGATION
-        for (s, a) in path:
-            N[(s, a)] += 1
-            Q[(s, a)] += reward
-            N_state[s] += 1
-            for rave_a in actions_played:
-                N_rave[(s, rave_a)] += 1
-                Q_rave[(s, rave_a)] += reward
+    def __repr__(self):
+        return f"UCTSearch({solver_key(partial(self.search, **self.kwargs))})"
+
+
+# ===============================
+#  Root-parallel UCT
+# ===============================
+# Worker pool reused across moves (rebuilt for another size or word list):
+# (n_workers, wordlist, executor), the word list being sent once per worker
+_POOL = None
+_WORKER_WORDLIST = None
+
+
+def _init_worker(wordlist):
+    global _WORKER_WORDLIST
+    _WORKER_WORDLIST = wordlist
+    table_for(wordlist)  # build or map the feedback table once per process
+
+
+def _worker_pool(n_workers, wordlist):
+    global _POOL
+    if _POOL is None or _POOL[0] != n_workers or _POOL[1] is not wordlist:
+        _shutdown_pool()
+        from concurrent.futures import ProcessPoolExecutor
+        _POOL = (n_workers, wordlist, ProcessPoolExecutor(max_workers=n_workers, initializer=_init_worker,
+                                                          initargs=(wordlist,)))
+    return _POOL[2]
+
+
+@atexit.register
+def _shutdown_pool():
+    global _POOL
+    if _POOL is not None:
+        _POOL[2].shutdown()
+        _POOL = None
+
+
+def _root_stats(search, state, wordlist, seed, kwargs):
+    # wordlist is None in the processes of _worker_pool, which already hold it
+    wordlist = _WORKER_WORDLIST if wordlist is None else wordlist
+    seed_all(seed)
+    info = {}
+    search(state, wordlist, info=info, **kwargs)
+    return info
+
+
+def root_parallel_search(state: WordleState, wordlist, search=uct_search, n_workers=4,
+                         executor=None, info=None, **kwargs):
+    """
+    Root parallelization: n_workers independent trees (one per process,
+    each with its own seed) built by 'search' (uct_search, uct_rave_search
+    or uct_grave_search, with **kwargs). Root statistics are summed before
+    choosing the move with the best mean reward. info["iterations"] sums
+    the iterations of all trees.
+    Without an executor, the processes of a pool kept across moves hold
+    'wordlist' (sent once per worker; shut down at exit). A given executor
+    receives the word list with every task: pass a feedback.WordList, whose
+    table is mapped instead of rebuilt.
+    Use functools.partial to get a (state, wordlist) -> move solver.
+    """
+    pool = executor or _worker_pool(n_workers, wordlist)
+    shared = None if executor is None else wordlist
+    seeds = [random.getrandbits(63) for _ in range(n_workers)]
+    futures = [pool.submit(_root_stats, search, state, shared, seed, kwargs) for seed in seeds]
+
+    N, Q = defaultdict(int), defaultdict(float)
+    iterations = 0
+    for future in futures:
+        worker_info = future.result()
+        iterations += worker_info["iterations"]
+        for a, (n, q) in worker_info["root"].items():
+            N[a] += n
+            Q[a] += q
+    if info is not None:
+        info["iterations"] = iterations
 
     legal = state.legal_moves(wordlist)
-    return max(legal, key=lambda a: Q[(state, a)] / (N[(state, a)] + 1e-9))
+    return max(legal, key=lambda a: Q[a] / (N[a] + 1e-9))
 
 
 # ===============================
 #  Nested Monte Carlo Search
 # ===============================
-def nested_mc_search(state: WordleState, wordlist, level=1, playout_fn=None):
+def nested_mc_search(state: WordleState, wordlist, level=1, playout_fn=None,
+                     time_budget_ms=None, info=None):
     """
     Nested Monte Carlo Search (NMCS).
     - Level 0: random playout
     - Level n: recursive search, keep best sequence found
+    With time_budget_ms, moves not yet evaluated at the deadline are skipped
+    (at every level) and the best move so far is returned.
+    info["iterations"] receives the number of playouts run.
     """
+    counter = [0]
+    move = _nested_mc(state, wordlist, level, playout_fn, make_deadline(time_budget_ms), counter)
+    if info is not None:
+        info["iterations"] = counter[0]
+    if instrumentation.TRACER is not None:
+        instrumentation.TRACER.search(counter[0])
+    return move
+
+
+def _nested_mc(state, wordlist, level, playout_fn, deadline, counter):
     if level == 0:
         return random.choice(state.legal_moves(wordlist))
 
     best_move, best_score = None, -float("inf")
+    next_state = state.clone()
 
     for move in state.legal_moves(wordlist):
-        next_state = state.clone()
-        next_state.play(move)
+        if best_move is not None and expired(deadline):
+            break
+        state.play_into(move, next_state)
 
         # Recursive call
         if next_state.is_terminal():
             score = 1.0 if next_state.is_won() else 0.0
         else:
-            nested_move = nested_mc_search(next_state, wordlist, level - 1, playout_fn)
+            nested_move = _nested_mc(next_state, wordlist, level - 1, playout_fn, deadline, counter)
             next_state.play(nested_move)
             score = (playout_fn(next_state, wordlist) if playout_fn else random_playout(next_state, wordlist))
+            counter[0] += 1
 
         if score > best_score:
             best_score, best_move = score, move
 
     return best_move
+
+
+# ===============================
+#  Named configurations
+# ===============================
+# Solvers selectable by name (CLI, service), as picklable partials
+SOLVERS = {
+    "random": random_solver,
+    "entropy": entropy_solver,
+    "flat_mc": partial(flat_mc, n_playouts=20),
+    "uct": partial(uct_search, n_iter=200, prior="entropy"),
+    "uct_rave": partial(uct_rave_search, n_iter=200, prior="entropy"),
+    "uct_grave": partial(uct_grave_search, n_iter=200, prior="entropy"),
+    "nmcs": partial(nested_mc_search, level=1),
+}
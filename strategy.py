@@ -0,0 +1,146 @@
+import json
+import os
+import random
+
+from feedback import ALL_GREEN, encode_pattern, table_for, wordlist_hash
+from opening_book import position_move
+from utils import derive_seed, solver_key
+
+
+STRATEGY_VERSION = 1
+
+
+# ===============================
+#  Building
+# ===============================
+def _build_subtree(solver, wordlist, history, secrets, max_attempts, n_samples, seed):
+    """
+    Decision tree below 'history' for the secrets still consistent with it.
+    Node: {"guess": word, "n": #secrets, "won": 1 if the guess is one of
+    them, "next": {code: node}} (codes as strings, JSON-ready); a missing
+    code means the game is won (GGGGG) or out of attempts.
+    """
+    rng = random.Random(seed)
+    sample = rng.sample(secrets, min(n_samples, len(secrets)))
+    guess = position_move(solver, wordlist, history, sample, seed)
+
+    table = table_for(wordlist)
+    groups = {}
+    for secret in secrets:
+        groups.setdefault(table.code(guess, secret), []).append(secret)
+
+    node = {"guess": guess, "n": len(secrets), "won": int(ALL_GREEN in groups), "next": {}}
+    if len(history) + 1 >= max_attempts:
+        return node
+    for code in sorted(groups):
+        if code == ALL_GREEN:
+            continue
+        node["next"][str(code)] = _build_subtree(
+            solver, wordlist, history + ((guess, code),), groups[code], max_attempts,
+            n_samples, derive_seed(seed, code))
+    return node
+
+
+def build_strategy(solver, wordlist, max_attempts=6, n_samples=1, seed=0, n_workers=1):
+    """
+    Walk every secret of 'wordlist' through 'solver', computing each decision
+    once per distinct guess/feedback history. Secrets sharing a history are
+    grouped; the decision is the solver's move for n_samples of them
+    (plurality vote, see opening_book.position_move).
+    The subtrees below the first guess are built in parallel when n_workers > 1
+    (the solver must then be picklable).
+    """
+    secrets = list(wordlist)
+    rng = random.Random(seed)
+    first = position_move(solver, wordlist, (), rng.sample(secrets, min(n_samples, len(secrets))),
+                          derive_seed(seed, 0))
+
+    table = table_for(wordlist)
+    groups = {}
+    for secret in secrets:
+        groups.setdefault(table.code(first, secret), []).append(secret)
+    codes = [code for code in sorted(groups) if code != ALL_GREEN] if max_attempts > 1 else []
+    jobs = [(solver, wordlist, ((first, code),), groups[code], max_attempts, n_samples,
+             derive_seed(seed, 1, code)) for code in codes]
+
+    if n_workers > 1 and jobs:
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=n_workers) as pool:
+            subtrees = list(pool.map(_build_subtree, *zip(*jobs)))
+    else:
+        subtrees = [_build_subtree(*job) for job in jobs]
+
+    return {"guess": first, "n": len(secrets), "won": int(ALL_GREEN in groups),
+            "next": {str(code): sub for code, sub in zip(codes, subtrees)}}
+
+
+def export_strategy(solver, wordlist, path, max_attempts=6, **build_kwargs):
+    """Build the strategy tree of 'solver' and write it as JSON to 'path'."""
+    tree = build_strategy(solver, wordlist, max_attempts=max_attempts, **build_kwargs)
+    data = {"version": STRATEGY_VERSION, "wordlist": wordlist_hash(wordlist),
+            "solver": solver_key(solver), "max_attempts": max_attempts, "tree": tree}
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(data, f, separators=(",", ":"))
+    os.replace(tmp, path)
+    return data
+
+
+# ===============================
+#  Serving
+# ===============================
+class StrategyPlayer:
+    """
+    Plays a precomputed strategy: the next guess for a history is found by
+    walking at most max_attempts tree edges, without any search.
+    Usable as a (state, wordlist) -> move solver.
+    """
+
+    def __init__(self, tree, max_attempts=6):
+        self.tree = tree
+        self.max_attempts = max_attempts
+
+    @classmethod
+    def load(cls, path, wordlist=None):
+        """Load an exported strategy (checked against 'wordlist' if given)."""
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") != STRATEGY_VERSION:
+            raise ValueError(f"Unsupported strategy version in {path}")
+        if wordlist is not None and data["wordlist"] != wordlist_hash(wordlist):
+            raise ValueError(f"Strategy {path} was built for another word list")
+        return cls(data["tree"], data["max_attempts"])
+
+    def next_guess(self, history):
+        """
+        Next guess after 'history', a sequence of (guess, feedback) where the
+        feedback is a 'G'/'Y'/'B' string or a pattern code. None if unknown.
+        """
+        node = self.tree
+        for guess, feedback in history:
+            code = encode_pattern(feedback) if isinstance(feedback, str) else feedback
+            if node is None or node["guess"] != guess:
+                return None
+            node = node["next"].get(str(code))
+        return None if node is None else node["guess"]
+
+    def __call__(self, state, wordlist=None):
+        return self.next_guess(state.history)
+
+    def distribution(self):
+        """{number of guesses: number of secrets} of the strategy (0 = lost)."""
+        counts = {}
+
+        def walk(node, depth):
+            if node["won"]:
+                counts[depth] = counts.get(depth, 0) + 1
+            children = node["next"].values()
+            lost = node["n"] - node["won"] - sum(child["n"] for child in children)
+            if lost:
+                counts[0] = counts.get(0, 0) + lost
+            for child in children:
+                walk(child, depth + 1)
+
+        walk(self.tree, 1)
+        return dict(sorted(counts.items()))
@@ -0,0 +1,171 @@
+"""
+Hyperparameter sweeps with successive halving.
+
+A search space maps solver keyword arguments to candidate values:
+{"c": [0.7, 1.41, 2.0], "rave_k": [100, 300, 1000]} (grid), or to
+callables rng -> value for random search. A dotted name sets a keyword
+of a nested function argument: {"playout_fn": [entropy_plus_playout],
+"playout_fn.alpha": [0.5, 0.7]}.
+
+Every configuration first plays the same min_games secrets; the best
+1/eta are kept and play eta times more games (the first games are
+reused), until one configuration is left or max_games is reached.
+Games are cached in a ResultStore under the configuration's solver_key,
+so a rerun (or a sweep sharing configurations) skips the completed
+(config, secret, seed) games.
+"""
+import itertools
+import random
+from concurrent.futures import as_completed
+from functools import partial
+
+from experiments import LOSS_COST, _worker_game, make_executor, play_recorded_game
+from results_store import ResultStore
+from utils import derive_seed, solver_key
+
+
+# ===============================
+#  Search spaces
+# ===============================
+def grid(space):
+    """Every combination of the value lists of 'space'."""
+    names = list(space)
+    return [dict(zip(names, values)) for values in itertools.product(*(space[n] for n in names))]
+
+
+def sample_space(space, n, seed=0):
+    """
+    n random configurations: lists are sampled uniformly, callables are
+    called with a random.Random. Duplicates are dropped.
+    """
+    rng = random.Random(seed)
+    configs, seen = [], set()
+    for _ in range(n):
+        config = {name: values(rng) if callable(values) else rng.choice(values)
+                  for name, values in space.items()}
+        key = repr(sorted(config.items(), key=lambda item: item[0]))
+        if key not in seen:
+            seen.add(key)
+            configs.append(config)
+    return configs
+
+
+def make_solver(search, params):
+    """
+    Picklable solver: partial(search, **params), dotted names (fn.arg)
+    binding 'arg' of the function passed as 'fn' (ValueError if 'fn' is
+    not in params).
+    """
+    kwargs = {name: value for name, value in params.items() if "." not in name}
+    for name, value in sorted(params.items()):
+        if "." in name:
+            fn, arg = name.split(".", 1)
+            if fn not in kwargs:
+                raise ValueError(f"parameter {name!r} needs a value for {fn!r} as well")
+            kwargs[fn] = partial(kwargs[fn], **{arg: value})
+    return partial(search, **kwargs)
+
+
+# ===============================
+#  Successive halving
+# ===============================
+def _play(jobs, wordlist, executor, on_game):
+    """Play (key, solver, secret, seed) jobs, in parallel when an executor is given."""
+    if executor is None:
+        for key, solver, secret, seed in jobs:
+            on_game(key, play_recorded_game(secret, solver, wordlist, seed))
+        return
+    futures = {executor.submit(_worker_game, i, secret, solver, seed): key
+               for i, (key, solver, secret, seed) in enumerate(jobs)}
+    for future in as_completed(futures):
+        on_game(futures[future], future.result()[1])
+
+
+def _row(key, params, records, rung):
+    n = len(records)
+    wins = [r["n_guesses"] for r in records if r["win"]]
+    return {
+        "config": key,
+        "params": params,
+        "rung": rung,
+        "games": n,
+        "win_rate": len(wins) / n,
+        "avg_guesses": sum(wins) / len(wins) if wins else 0.0,
+        "mean_cost": sum(r["n_guesses"] or LOSS_COST for r in records) / n,
+        "cpu_s_per_game": sum(r["cpu_s"] for r in records) / n,
+    }
+
+
+def successive_halving(search, configs, wordlist, min_games=10, max_games=None, eta=3,
+                       seed=0, n_workers=1, store=None, verbose=True):
+    """
+    Rank 'configs' (dicts of keyword arguments of 'search', see make_solver)
+    by mean cost per game (number of guesses, LOSS_COST if lost) with
+    successive halving. All configurations play the same secrets and
+    per-game seeds. Games run on a process pool when n_workers > 1, and are
+    cached in 'store' (ResultStore or path) when given.
+    Returns the rows of the ranked table: configurations that reached a
+    later rung first, then by mean cost.
+    """
+    max_games = min(max_games or len(wordlist), len(wordlist))
+    secrets = random.Random(seed).sample(wordlist, max_games)
+    seeds = [derive_seed(seed, i) for i in range(max_games)]
+    solvers = {}
+    for params in configs:
+        solver = make_solver(search, params)
+        solvers.setdefault(solver_key(solver), (solver, params))
+
+    own_store = isinstance(store, str)
+    if own_store:
+        store = ResultStore(store)
+    cache = {}
+    if store is not None:
+        for r in store:
+            if r["solver"] in solvers and "cpu_s" in r:
+                cache[r["solver"], r["secret"], r["seed"]] = r
+
+    def on_game(key, game):
+        cache[key, game["secret"], game["seed"]] = game
+        if store is not None:
+            store.append({"solver": key, "config": key, **game})
+
+    executor = make_executor(wordlist, n_workers) if n_workers > 1 else None
+    rows = {}
+    alive = list(solvers)
+    n_games, rung = min(min_games, max_games), 0
+    try:
+        while True:
+            jobs = [(key, solvers[key][0], secret, s)
+                    for key in alive for secret, s in zip(secrets[:n_games], seeds[:n_games])
+                    if (key, secret, s) not in cache]
+            _play(jobs, wordlist, executor, on_game)
+            for key in alive:
+                records = [cache[key, secret, s] for secret, s in zip(secrets[:n_games], seeds[:n_games])]
+                rows[key] = _row(key, solvers[key][1], records, rung)
+            alive.sort(key=lambda k: (rows[k]["mean_cost"], rows[k]["cpu_s_per_game"]))
+            if verbose:
+                print(f"rung {rung}: {len(alive)} configs x {n_games} games "
+                      f"({len(jobs)} played), best {alive[0]} cost {rows[alive[0]]['mean_cost']:.3f}")
+            if len(alive) == 1 or n_games >= max_games:
+                break
+            alive = alive[:max(1, len(alive) // eta)]
+            n_games, rung = min(n_games * eta, max_games), rung + 1
+    finally:
+        if executor is not None:
+            executor.shutdown()
+        if own_store:
+            store.close()
+
+    return sorted(rows.values(), key=lambda r: (-r["rung"], r["mean_cost"], r["cpu_s_per_game"]))
+
+
+def format_table(rows):
+    """Ranked table as text."""
+    lines = [f"{'#':>3}  {'rung':>4}  {'games':>5}  {'win':>6}  {'guesses':>7}  {'cost':>6}  "
+             f"{'cpu s/game':>10}  config"]
+    for rank, r in enumerate(rows, 1):
+        params = ", ".join(f"{k}={getattr(v, '__name__', v)}" for k, v in r["params"].items())
+        lines.append(f"{rank:>3}  {r['rung']:>4}  {r['games']:>5}  {r['win_rate']:>6.3f}  "
+                     f"{r['avg_guesses']:>7.3f}  {r['mean_cost']:>6.3f}  {r['cpu_s_per_game']:>10.4f}  "
+                     f"{params}")
+    return "\n".join(lines)
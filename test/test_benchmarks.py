@@ -0,0 +1,33 @@
+from benchmarks.bench_state import deepcopy_clone
+from benchmarks.suite import compare, load_baseline, run_suite, save_baseline
+from wordle import WordleState
+
+
+def test_compare_flags_only_drops_beyond_threshold():
+    baseline = {"a": {"ops_per_sec": 100.0}, "b": {"ops_per_sec": 100.0}, "gone": {"ops_per_sec": 1.0}}
+    results = {"a": {"ops_per_sec": 80.0}, "b": {"ops_per_sec": 60.0}, "new": {"ops_per_sec": 1.0}}
+    regressions = compare(results, baseline, threshold=0.25)
+    assert [name for name, *_ in regressions] == ["b"]
+    assert regressions[0][3] == -0.4
+
+
+def test_quick_run_roundtrips_baseline(tmp_path):
+    results = run_suite(sizes=[50], quick=True, only="uct_search")
+    assert list(results) == ["solver uct_search(n_iter=100) [n=50]"]
+    stats = results["solver uct_search(n_iter=100) [n=50]"]
+    assert stats["ops_per_sec"] > 0 and stats["p50_ms"] <= stats["p95_ms"] <= stats["p99_ms"]
+
+    path = str(tmp_path / "baseline.json")
+    save_baseline(results, path)
+    assert load_baseline(path) == results
+    assert compare(results, load_baseline(path)) == []
+
+
+def test_deepcopy_baseline_clone_stays_bound():
+    wordlist = ["crane", "trace", "stone", "spill", "party"]
+    state = WordleState("crane")
+    state.legal_moves(wordlist)
+    clone = deepcopy_clone(state)
+    assert clone.table is state.table and clone.candidates is not state.candidates
+    clone.play("stone")
+    assert len(clone.candidates) < len(state.candidates) == len(wordlist)
@@ -0,0 +1,44 @@
+import os
+import subprocess
+import sys
+
+from cli import main
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+WORDS = ["crane", "trace", "stone", "spill", "party", "apple", "grape", "melon"]
+
+
+def write_wordlist(tmp_path):
+    path = tmp_path / "words.txt"
+    path.write_text("\n".join(WORDS) + "\n")
+    return str(path)
+
+
+def test_solve_next_guess(tmp_path, capsys):
+    path = write_wordlist(tmp_path)
+    assert main(["solve", "--wordlist", path, "--solver", "entropy", "--history", "crane:BBBBB"]) == 0
+    assert capsys.readouterr().out.strip() == "spill"
+    assert main(["solve", "--wordlist", path, "--history", "crane:GGGGG"]) == 1
+    assert main(["solve", "--wordlist", path, "--history", "cranes:BBBBB"]) == 1
+    assert "error: bad guess" in capsys.readouterr().err
+
+
+def test_solve_full_game_and_evaluate(tmp_path, capsys):
+    path = write_wordlist(tmp_path)
+    assert main(["solve", "--wordlist", path, "--solver", "entropy", "--secret", "melon"]) == 0
+    assert capsys.readouterr().out.strip().splitlines()[-1].startswith("win")
+    assert main(["evaluate", "--wordlist", path, "--solver", "random", "--games", "4", "--seed", "0"]) == 0
+    assert "win rate" in capsys.readouterr().out
+
+
+def test_solve_path_does_not_import_plotting(tmp_path):
+    path = write_wordlist(tmp_path)
+    code = ("import sys, cli; cli.main(['solve', '--wordlist', %r, '--solver', 'uct', "
+            "'--history', 'crane:BBBBB']); "
+            "assert not {'matplotlib', 'pandas'} & set(sys.modules), sys.modules.keys()" % path)
+    subprocess.run([sys.executable, "-c", code], cwd=ROOT, check=True, capture_output=True)
+
+
+def test_bench_forwards_its_options(capsys):
+    assert main(["bench", "--quick", "--only", "clone", "--sizes", "50"]) == 0
+    assert "clone [n=50]" in capsys.readouterr().out
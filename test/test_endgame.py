@@ -0,0 +1,61 @@
+import itertools
+from functools import partial
+
+import numpy as np
+
+from endgame import EndgamePlayout, EndgameSolver, solve, solve_state
+from feedback import ALL_GREEN, FeedbackTable
+from solvers import random_solver, uct_search
+from utils import solver_key
+from wordle import WordleState
+
+WORDLIST = ["crane", "trace", "stone", "spill", "party", "apple", "grape", "melon"]
+
+
+def brute_force_win(table, candidates, attempts_left):
+    if attempts_left == 0 or not candidates:
+        return 0.0
+    best = 0.0
+    for guess in candidates:
+        win = 0.0
+        codes = {}
+        for s in candidates:
+            codes.setdefault(int(table.matrix[guess, s]), []).append(s)
+        for code, part in codes.items():
+            if code == ALL_GREEN:
+                win += 1 / len(candidates)
+            else:
+                win += len(part) / len(candidates) * brute_force_win(table, part, attempts_left - 1)
+        best = max(best, win)
+    return best
+
+
+def test_solve_matches_brute_force():
+    table = FeedbackTable(WORDLIST)
+    for size, attempts in itertools.product([2, 3, 5], [1, 2, 3]):
+        candidates = list(range(size))
+        win, guesses, best = solve(table, np.array(candidates), attempts)
+        assert abs(win - brute_force_win(table, candidates, attempts)) < 1e-9
+        assert best in candidates
+        assert 1.0 <= guesses <= attempts
+
+
+def test_two_candidates_one_attempt():
+    table = FeedbackTable(WORDLIST)
+    win, guesses, _ = solve(table, np.array([0, 1]), 1)
+    assert win == 0.5 and guesses == 1.0
+
+
+def test_endgame_playout_and_solver():
+    state = WordleState("stone")
+    state.play("party")
+    value = EndgamePlayout(threshold=20)(state, WORDLIST)
+    assert value == solve_state(state, WORDLIST)[0]
+    assert EndgameSolver(random_solver)(state, WORDLIST) in state.legal_moves(WORDLIST)
+    move = uct_search(state, WORDLIST, n_iter=10, playout_fn=EndgamePlayout())
+    assert move in state.legal_moves(WORDLIST)
+
+
+def test_endgame_wrappers_have_stable_keys():
+    solver = EndgameSolver(partial(uct_search, n_iter=10), threshold=5)
+    assert solver_key(solver) == "EndgameSolver(uct_search(n_iter=10), threshold=5)"
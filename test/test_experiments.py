@@ -0,0 +1,122 @@
+import math
+from functools import partial
+
+from experiments import (
+    MIN_PAIRED_GAMES,
+    evaluate,
+    evaluate_adaptive,
+    evaluate_exhaustive,
+    mean_interval,
+    play_game,
+    t_quantile,
+    wilson_interval,
+)
+from playouts import random_playout
+from solvers import flat_mc, random_solver
+
+WORDLIST = ["crane", "trace", "stone", "spill", "party", "apple", "grape", "melon"]
+
+
+def test_play_game_terminates():
+    state = play_game("crane", random_solver, WORDLIST)
+    assert state.is_terminal()
+
+
+def test_evaluate_is_independent_of_worker_count():
+    solver = partial(flat_mc, n_playouts=3, playout_fn=random_playout)
+    serial = evaluate(solver, WORDLIST, n_games=6, seed=7)
+    parallel = evaluate(solver, WORDLIST, n_games=6, seed=7, n_workers=2)
+    assert serial["distribution"] == parallel["distribution"]
+
+
+def test_evaluate_streams_results():
+    seen = []
+    stats = evaluate(random_solver, WORDLIST, n_games=4, seed=1,
+                     on_result=lambda i, secret, guesses: seen.append(i))
+    assert sorted(seen) == list(range(4))
+    assert stats["n_games"] == 4
+
+
+def test_exhaustive_evaluation_matches_independent_games():
+    def first_candidate(state, wordlist):
+        return state.legal_moves(wordlist)[0]
+
+    stats = evaluate_exhaustive(first_candidate, WORDLIST)
+    expected = []
+    for secret in WORDLIST:
+        state = play_game(secret, first_candidate, WORDLIST)
+        expected.append(len(state.history) if state.is_won() else 0)
+    assert stats["distribution"] == expected
+    assert stats["decisions"] < len(WORDLIST) * 2
+
+
+def test_exhaustive_evaluation_is_reproducible():
+    a = evaluate_exhaustive(random_solver, WORDLIST, seed=5, cache_size=2)
+    b = evaluate_exhaustive(random_solver, WORDLIST, seed=5, cache_size=2)
+    assert a["distribution"] == b["distribution"]
+
+
+def test_confidence_intervals():
+    lo, hi = wilson_interval(45, 50)
+    assert 0.78 < lo < 0.9 < hi < 0.97
+    assert wilson_interval(0, 0) == (0.0, 1.0)
+    lo, hi = mean_interval([3, 4, 3, 4])
+    assert lo < 3.5 < hi
+    assert mean_interval([3]) == (-math.inf, math.inf)
+    # Student-t: wider than the normal interval for few values
+    assert abs(t_quantile(0.975, 1) - 12.706) < 1e-3
+    assert abs(t_quantile(0.975, 10) - 2.228) < 1e-3
+
+
+def test_adaptive_evaluation_uses_common_secrets_and_stops_early():
+    def first_candidate(state, wordlist):
+        return state.legal_moves(wordlist)[0]
+
+    solvers = {"random": random_solver, "first": first_candidate}
+    result = evaluate_adaptive(solvers, WORDLIST, win_width=0.9, guesses_width=10, batch_size=3,
+                               seed=2)
+    stats = result["solvers"]
+    assert all(s["stopped"] == "precision" for s in stats.values())
+    assert stats["random"]["n_games"] == stats["first"]["n_games"] < len(WORDLIST)
+
+    exhaustive = evaluate_adaptive({"first": first_candidate}, WORDLIST, win_width=0, seed=2)
+    assert exhaustive["solvers"]["first"]["stopped"] == "max_games"
+    assert exhaustive["solvers"]["first"]["n_games"] == len(WORDLIST)
+
+
+def test_adaptive_comparison_stops_once_decided():
+    def lose(state, wordlist):
+        return None
+
+    def first_candidate(state, wordlist):
+        return state.legal_moves(wordlist)[0]
+
+    result = evaluate_adaptive({"first": first_candidate, "lose": lose}, WORDLIST, win_width=0,
+                               batch_size=2, compare=True)
+    pair = result["pairs"][("first", "lose")]
+    assert pair["decided"] and pair["diff"] < 0
+    assert {s["stopped"] for s in result["solvers"].values()} == {"decided"}
+    assert result["solvers"]["lose"]["n_games"] < len(WORDLIST)
+
+
+def test_adaptive_comparison_keeps_stopped_partners_playing():
+    def lose(state, wordlist):
+        return None
+
+    games = []
+
+    def alternate(state, wordlist):
+        # wins in one guess every other game, in two otherwise
+        if not state.history:
+            games.append(state.secret)
+            if len(games) % 2 == 0:
+                return next(w for w in wordlist if w != state.secret)
+        return state.secret
+
+    # "lose" is precise after one game, long before the comparison can be decided
+    result = evaluate_adaptive({"alternate": alternate, "lose": lose}, WORDLIST, win_width=0.8,
+                               guesses_width=0, batch_size=1, compare=True)
+    stats = result["solvers"]
+    assert stats["lose"]["stopped"] == "precision" and stats["alternate"]["stopped"] == "decided"
+    n_games = stats["alternate"]["n_games"]
+    assert stats["lose"]["n_games"] == n_games and MIN_PAIRED_GAMES <= n_games < len(WORDLIST)
@@ -0,0 +1,112 @@
+import random
+import pytest
+from feedback import (
+    ALL_GREEN,
+    FeedbackTable,
+    decode_pattern,
+    encode_pattern,
+    pattern_code,
+    table_for,
+)
+from wordle import WordleState
+
+WORDLIST = ["crane", "trace", "stone", "spill", "party", "apple", "grape", "melon"]
+
+
+def reference_feedback(candidate, guess):
+    result = []
+    for i, c in enumerate(guess):
+        if c == candidate[i]:
+            result.append("G")
+        elif c in candidate:
+            result.append("Y")
+        else:
+            result.append("B")
+    return "".join(result)
+
+
+def test_encode_decode_roundtrip():
+    for code in range(243):
+        assert encode_pattern(decode_pattern(code)) == code
+    assert encode_pattern("GGGGG") == ALL_GREEN
+
+
+def test_matrix_matches_reference():
+    table = FeedbackTable(WORDLIST)
+    for g, guess in enumerate(WORDLIST):
+        for s, secret in enumerate(WORDLIST):
+            expected = reference_feedback(secret, guess)
+            assert decode_pattern(int(table.matrix[g, s])) == expected
+            assert pattern_code(secret, guess) == encode_pattern(expected)
+
+
+def test_unknown_word_falls_back():
+    table = FeedbackTable(WORDLIST)
+    assert decode_pattern(table.code("zzzzz", "crane")) == "BBBBB"
+
+
+def test_table_for_is_cached():
+    assert table_for(WORDLIST) is table_for(WORDLIST)
+
+
+def test_legal_moves_matches_reference():
+    rng = random.Random(0)
+    for _ in range(20):
+        secret = rng.choice(WORDLIST)
+        state = WordleState(secret)
+        for guess in rng.sample(WORDLIST, 2):
+            state.play(guess)
+        expected = [w for w in WORDLIST
+                    if all(reference_feedback(w, g) == fb for g, fb in state.attempts)]
+        assert state.legal_moves(WORDLIST) == expected
+
+
+def test_disk_cache_roundtrip(tmp_path):
+    from feedback import WordList, cache_path, load_table
+    import numpy as np
+    import pickle
+
+    table = load_table(WORDLIST, cache_dir=str(tmp_path))
+    assert isinstance(table.matrix.base, np.memmap)
+    assert (np.asarray(table.matrix) == FeedbackTable(WORDLIST).matrix).all()
+    assert cache_path(WORDLIST, str(tmp_path)) != cache_path(WORDLIST[:-1], str(tmp_path))
+
+    words = WordList(WORDLIST, cache_dir=str(tmp_path))
+    assert table_for(words) is words.table
+    clone = pickle.loads(pickle.dumps(words))
+    assert clone == words and clone.cache_dir == words.cache_dir
+
+
+def test_stale_cache_is_rebuilt(tmp_path):
+    from feedback import cache_path, load_table
+
+    path = cache_path(WORDLIST, str(tmp_path))
+    load_table(WORDLIST, cache_dir=str(tmp_path))
+    with open(path, "r+b") as f:
+        f.truncate(100)
+    table = load_table(WORDLIST, cache_dir=str(tmp_path))
+    assert table.matrix.shape == (len(WORDLIST), len(WORDLIST))
+
+
+def test_candidates_narrow_incrementally():
+    state = WordleState("crane")
+    assert state.legal_moves(WORDLIST) == WORDLIST
+    state.play("trace")
+    moves = state.legal_moves(WORDLIST)
+    assert moves is state.legal_moves(WORDLIST)
+    assert len(state.candidates) == len(moves)
+    clone = state.clone()
+    clone.play("crane")
+    assert clone.legal_moves(WORDLIST) == ["crane"]
+    assert state.legal_moves(WORDLIST) == moves
+
+
+def test_state_key_merges_transpositions():
+    a, b = WordleState("crane"), WordleState("crane")
+    a.legal_moves(WORDLIST)
+    b.legal_moves(WORDLIST)
+    a.play("stone"); a.play("party")
+    b.play("party"); b.play("stone")
+    assert a.key() == b.key()
+    a.play("crane")
+    assert a.key() != b.key()
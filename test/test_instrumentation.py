@@ -0,0 +1,39 @@
+import json
+from functools import partial
+
+import instrumentation
+from experiments import play_game
+from instrumentation import tracing
+from solvers import flat_mc, uct_rave_search
+
+WORDLIST = ["crane", "trace", "stone", "spill", "party", "apple", "grape", "melon"]
+
+
+def test_disabled_by_default():
+    assert instrumentation.TRACER is None
+
+
+def test_trace_records_phases_and_jsonl(tmp_path):
+    path = tmp_path / "trace.jsonl"
+    with tracing(str(path)) as tracer:
+        state = play_game("melon", partial(uct_rave_search, n_iter=15), WORDLIST)
+    assert instrumentation.TRACER is None
+
+    lines = [json.loads(line) for line in path.read_text().splitlines()]
+    assert len(lines) == len(state.history) == len(tracer.records)
+    first = lines[0]
+    assert first["move"] == 0 and first["candidates"] == len(WORDLIST)
+    assert first["iterations"] == 15
+    assert set(first["phases"]) == {"selection", "expansion", "simulation", "backpropagation"}
+    assert first["playouts"] > 0
+
+    summary = tracer.summary()["uct_rave_search(n_iter=15)"]
+    assert summary["moves"] == len(state.history)
+    assert "selection" in tracer.report()
+
+
+def test_flat_mc_reports_playout_lengths():
+    with tracing() as tracer:
+        play_game("crane", partial(flat_mc, n_playouts=4, batch_size=4), WORDLIST)
+    assert tracer.records[0]["playouts"] == 4 * len(WORDLIST)
+    assert tracer.summary()["flat_mc(batch_size=4, n_playouts=4)"]["playout_length_mean"] > 0
@@ -0,0 +1,54 @@
+from functools import partial
+
+from feedback import encode_pattern
+from opening_book import (
+    BookSolver,
+    OpeningBook,
+    build_opening_book,
+    load_or_build_book,
+)
+from playouts import random_playout
+from solvers import flat_mc, random_solver
+from utils import solver_key
+from wordle import WordleState
+
+WORDLIST = ["crane", "trace", "stone", "spill", "party", "apple", "grape", "melon"]
+
+
+def first_candidate(state, wordlist):
+    return state.legal_moves(wordlist)[0]
+
+
+def test_solver_key_describes_configuration():
+    solver = partial(flat_mc, n_playouts=5, playout_fn=random_playout)
+    assert solver_key(solver) == "flat_mc(n_playouts=5, playout_fn=random_playout)"
+
+
+def test_book_solver_key_differs_from_wrapped_solver():
+    solver = partial(flat_mc, n_playouts=5)
+    book = BookSolver(solver, OpeningBook("crane", {}))
+    assert solver_key(book) == "book(flat_mc(n_playouts=5))"
+
+
+def test_book_covers_every_first_feedback():
+    book = build_opening_book(first_candidate, WORDLIST, n_samples=3)
+    assert book.first == "crane"
+    state = WordleState("stone")
+    state.play(book.first)
+    assert book.lookup(state) == first_candidate(state, WORDLIST)
+
+
+def test_book_solver_falls_back_out_of_book():
+    book = OpeningBook("crane", {encode_pattern("BBBBB"): "spill"})
+    solver = BookSolver(random_solver, book)
+    state = WordleState("party")
+    assert solver(state, WORDLIST) == "crane"
+    state.play("stone")
+    assert solver(state, WORDLIST) in WORDLIST
+
+
+def test_book_is_cached(tmp_path):
+    solver = partial(flat_mc, n_playouts=2)
+    book = load_or_build_book(solver, WORDLIST, cache_dir=str(tmp_path), n_samples=2)
+    assert load_or_build_book(solver, WORDLIST, cache_dir=str(tmp_path)).to_dict() == book.to_dict()
+    assert len(list(tmp_path.iterdir())) == 1
@@ -6,6 +6,8 @@ from playouts import (
     frequency_playout,
     entropy_plus_playout,
     frequency_plus_playout,
+    batch_random_playout,
+    run_playouts,
 )
 
 class TestPlayouts(unittest.TestCase):
@@ -40,5 +42,31 @@ class TestPlayouts(unittest.TestCase):
         self.assertIn(result, [0.0, 1.0])
 
 
+class TestBatchedPlayouts(unittest.TestCase):
+    def setUp(self):
+        self.wordlist = ["apple", "grape", "peach", "melon", "berry"]
+
+    def test_batch_random_playout_shape(self):
+        state = WordleState("apple")
+        rewards = batch_random_playout(state, self.wordlist, 32)
+        self.assertEqual(rewards.shape, (32,))
+        self.assertTrue(set(rewards.tolist()) <= {0.0, 1.0})
+
+    def test_batch_playout_single_candidate_always_wins(self):
+        state = WordleState("apple")
+        state.play("apple")
+        self.assertEqual(batch_random_playout(state, self.wordlist, 8).tolist(), [1.0] * 8)
+        state = WordleState("melon", max_attempts=2)
+        state.play("berry")
+        # One guess left: win only if the random pick is the secret
+        rewards = batch_random_playout(state, self.wordlist, 200)
+        self.assertTrue(0.0 < rewards.mean() < 1.0)
+
+    def test_run_playouts_falls_back_to_loop(self):
+        state = WordleState("apple")
+        rewards = run_playouts(state, self.wordlist, frequency_playout, 3)
+        self.assertEqual(len(rewards), 3)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,89 @@
+from functools import partial
+
+import pytest
+
+import experiments
+from experiments import evaluate, play_recorded_game
+from results_store import ResultStore
+from solvers import random_solver
+
+WORDLIST = ["crane", "trace", "stone", "spill", "party", "apple", "grape", "melon"]
+
+
+def game(solver, secret, n_guesses, seed=0):
+    return {"solver": solver, "config": solver, "seed": seed, "secret": secret,
+            "guesses": [secret] * (n_guesses or 6), "n_guesses": n_guesses,
+            "win": n_guesses > 0, "move_ms": [1.0, 3.0]}
+
+
+def test_streaming_aggregates(tmp_path):
+    with ResultStore(str(tmp_path / "games.jsonl")) as store:
+        for record in (game("a", "crane", 2), game("a", "stone", 0), game("b", "crane", 4)):
+            store.append(record)
+    store = ResultStore(str(tmp_path / "games.jsonl"))
+    assert store.keys() == {("a", "a", "crane", 0), ("a", "a", "stone", 0), ("b", "b", "crane", 0)}
+    summary = store.summary()
+    assert summary["a"]["win_rate"] == 0.5 and summary["a"]["avg_guesses"] == 2
+    assert summary["b"]["move_ms_mean"] == 2.0
+    assert store.distribution() == {"a": {2: 1, 0: 1}, "b": {4: 1}}
+    dist = store.distribution_frame()
+    assert dist[dist["Solver"] == "a"]["Guesses"].tolist() == ["fail", "2"]
+
+
+def test_torn_last_line_is_skipped_and_repaired(tmp_path):
+    path = tmp_path / "games.jsonl"
+    with ResultStore(str(path)) as store:
+        store.append(game("a", "crane", 3))
+    with open(path, "a") as f:
+        f.write('{"solver": "a", "sec')  # crash mid-write
+    store = ResultStore(str(path))
+    assert len(list(store)) == 1
+    store.append(game("a", "grape", 2))
+    store.close()
+    assert [r["secret"] for r in ResultStore(str(path))] == ["crane", "grape"]
+
+
+def test_evaluate_resumes_after_a_crash(tmp_path, monkeypatch):
+    path = str(tmp_path / "games.jsonl")
+    full = evaluate(random_solver, WORDLIST, n_games=6, seed=3, store=str(tmp_path / "ref.jsonl"))
+
+    def crash(index, secret, guesses):
+        if len(list(ResultStore(path))) == 2:
+            raise KeyboardInterrupt
+
+    with pytest.raises(KeyboardInterrupt):
+        evaluate(random_solver, WORDLIST, n_games=6, seed=3, store=path, name="random", on_result=crash)
+    assert len(list(ResultStore(path))) == 2
+
+    played = []
+
+    def counting_game(secret, solver, wordlist, seed=None):
+        played.append(secret)
+        return play_recorded_game(secret, solver, wordlist, seed)
+
+    monkeypatch.setattr(experiments, "play_recorded_game", counting_game)
+    resumed = evaluate(random_solver, WORDLIST, n_games=6, seed=3, store=path, name="random")
+    records = list(ResultStore(path))
+    assert len(records) == 6 and len(ResultStore(path).keys()) == 6
+    assert resumed["distribution"] == full["distribution"]
+    assert played == [r["secret"] for r in records[2:]]
+    assert all(len(r["move_ms"]) == len(r["guesses"]) for r in records)
+
+
+def test_resume_ignores_games_of_another_configuration(tmp_path):
+    path = str(tmp_path / "games.jsonl")
+    evaluate(random_solver, WORDLIST, n_games=3, seed=3, store=path, name="random")
+    evaluate(partial(random_solver), WORDLIST, n_games=3, seed=3, store=path, name="random")
+    records = list(ResultStore(path))
+    assert len(records) == 6
+    assert [r["config"] for r in records[3:]] == ["random_solver()"] * 3
+
+
+def test_aggregates_separate_configurations_sharing_a_name(tmp_path):
+    with ResultStore(str(tmp_path / "games.jsonl")) as store:
+        store.append(game("a", "crane", 2))
+        store.append({**game("a", "crane", 0), "config": "book(a)"})
+        store.append(game("b", "crane", 4))
+    store = ResultStore(str(tmp_path / "games.jsonl"))
+    assert list(store.summary()) == ["a [a]", "a [book(a)]", "b"]
+    assert store.distribution() == {"a [a]": {2: 1}, "a [book(a)]": {0: 1}, "b": {4: 1}}
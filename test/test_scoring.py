@@ -0,0 +1,54 @@
+import math
+from collections import Counter
+
+import numpy as np
+
+from feedback import FeedbackTable, pattern_code
+from scoring import entropy_scores, entropy_scores_many, pattern_histograms
+
+WORDLIST = ["crane", "trace", "stone", "spill", "party", "apple", "grape", "melon"]
+
+
+def reference_entropy(guess, candidates):
+    counts = Counter(pattern_code(w, guess) for w in candidates)
+    total = len(candidates)
+    return -sum(n / total * math.log2(n / total) for n in counts.values())
+
+
+def test_histograms_count_every_candidate():
+    table = FeedbackTable(WORDLIST)
+    candidates = np.array([0, 2, 3, 5])
+    counts = pattern_histograms(table, candidates, table.all_indices())
+    assert counts.shape == (len(WORDLIST), 243)
+    assert (counts.sum(axis=1) == len(candidates)).all()
+
+
+def test_entropy_matches_reference():
+    table = FeedbackTable(WORDLIST)
+    candidates = np.array([1, 2, 4, 6, 7])
+    scores = entropy_scores(table, candidates, table.all_indices())
+    subset = [WORDLIST[i] for i in candidates]
+    for g, guess in enumerate(WORDLIST):
+        assert math.isclose(scores[g], reference_entropy(guess, subset), abs_tol=1e-9)
+
+
+def test_single_candidate_has_zero_entropy():
+    table = FeedbackTable(WORDLIST)
+    assert entropy_scores(table, np.array([3])).tolist() == [0.0]
+
+
+def test_letter_frequency_scores_counts_distinct_letters():
+    from scoring import letter_frequency_scores
+    scores = letter_frequency_scores(["aab", "abc"])
+    # a: 3, b: 2, c: 1
+    assert scores.tolist() == [5.0, 6.0]
+
+
+def test_entropy_scores_many_matches_single_calls():
+    table = FeedbackTable(WORDLIST)
+    sets = [np.array([0, 2, 3, 5]), np.array([], dtype=int), np.array([1, 2, 4, 6, 7]), np.array([3])]
+    many = entropy_scores_many(table, sets)
+    assert len(many[1]) == 0
+    for candidates, scores in zip(sets, many):
+        if len(candidates):
+            assert np.allclose(scores, entropy_scores(table, candidates))
@@ -0,0 +1,100 @@
+import asyncio
+import json
+import random
+import time
+
+import numpy as np
+from feedback import FeedbackTable, PATTERNS, WordList
+from scoring import entropy_scores
+from service import MoveService, handle
+
+WORDLIST = WordList(["crane", "trace", "stone", "spill", "party", "apple", "grape", "melon"], cache_dir=None)
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+def test_concurrent_entropy_requests_are_batched_and_shared():
+    table = FeedbackTable(WORDLIST)
+    code = table.code("crane", "grape")
+
+    async def scenario():
+        async with MoveService(WORDLIST, max_wait_ms=20) as service:
+            moves = await asyncio.gather(
+                *[service.next_move([["crane", PATTERNS[code]]]) for _ in range(5)],
+                service.next_move([]))
+            again = await service.next_move([["crane", code]])
+            return moves, again, service.stats()
+
+    moves, again, stats = run(scenario())
+    candidates = table.filter(table.all_indices(), "crane", code)
+    expected = WORDLIST[int(candidates[np.argmax(entropy_scores(table, candidates))])]
+    assert moves[:5] == [expected] * 5 and again == expected
+    assert moves[5] == WORDLIST[int(np.argmax(entropy_scores(table, table.all_indices())))]
+    assert stats["requests"] == 7 and stats["cache_hits"] == 1
+    assert stats["shared"] == 4 and stats["batch_size_max"] == 6
+    assert stats["latency_p50_ms"] >= 0 and stats["queue_depth"] == 0
+
+
+def test_search_solvers_run_off_the_loop_and_are_deterministic():
+    async def scenario(seed):
+        async with MoveService(WORDLIST, seed=seed) as service:
+            return await asyncio.gather(*[service.next_move([["crane", "BBBBB"]], solver)
+                                          for solver in ("uct", "flat_mc", "random")])
+
+    moves = run(scenario(3))
+    assert all(move in WORDLIST for move in moves)
+    assert run(scenario(3)) == moves
+
+
+def slow_random(state, wordlist):
+    # Seeded by the service, then long enough to overlap with other searches
+    time.sleep(0.005)
+    return random.choice(wordlist)
+
+
+def test_concurrent_searches_match_sequential_answers():
+    table = FeedbackTable(WORDLIST)
+    solvers = {"slow_random": slow_random}
+    keys = [([], "slow_random")] + [([[word, PATTERNS[table.code(word, "melon")]]], "slow_random")
+                                    for word in WORDLIST if word != "melon"]
+
+    async def concurrent():
+        async with MoveService(WORDLIST, seed=5, solvers=solvers) as service:
+            return await asyncio.gather(*[service.next_move(history, solver) for history, solver in keys])
+
+    async def sequential():
+        async with MoveService(WORDLIST, seed=5, solvers=solvers) as service:
+            return [await service.next_move(history, solver) for history, solver in keys]
+
+    assert run(concurrent()) == run(sequential())
+
+
+def test_handle_json_lines():
+    async def scenario():
+        async with MoveService(WORDLIST) as service:
+            ok = await handle(service, json.dumps({"id": 1, "history": []}))
+            bad = await handle(service, json.dumps({"id": 2, "history": [], "solver": "nope"}))
+            over = await handle(service, json.dumps({"id": 3, "history": [["crane", "GGGGG"]]}))
+            stats = await handle(service, json.dumps({"id": 4, "op": "stats"}))
+            return ok, bad, over, stats
+
+    ok, bad, over, stats = run(scenario())
+    assert ok["id"] == 1 and ok["move"] in WORDLIST
+    assert "unknown solver" in bad["error"]
+    assert "over" in over["error"]
+    assert stats["stats"]["requests"] == 2
+
+
+def test_bad_requests_do_not_stop_the_service():
+    async def scenario(wordlist):
+        async with MoveService(wordlist) as service:
+            bad = await handle(service, json.dumps({"id": 1, "history": [["cranes", "BBBBB"]]}))
+            good = await asyncio.wait_for(service.next_move([["crane", "BBBBB"]]), 5)
+            return bad, good
+
+    for wordlist in (WORDLIST, list(WORDLIST)):
+        bad, good = run(scenario(wordlist))
+        assert "bad guess" in bad["error"]
+        assert good in WORDLIST
@@ -1,7 +1,19 @@
 import pytest
+import solvers
 from wordle import WordleState
-from solvers import random_solver, flat_mc, uct_search
+from solvers import (
+    random_solver,
+    flat_mc,
+    uct_search,
+    uct_rave_search,
+    uct_grave_search,
+    root_parallel_search,
+    nested_mc_search,
+    UCTSearch,
+    SearchTree,
+)
 from playouts import random_playout, entropy_playout, frequency_playout
+from utils import solver_key
 
 # Petit dictionnaire de test
 WORDLIST = ["crane", "trace", "stone", "spill", "party"]
@@ -30,3 +42,122 @@ def test_uct_search_with_frequency_playout():
     state = WordleState("crane")
     move = uct_search(state, WORDLIST, n_iter=20, playout_fn=frequency_playout)
     assert move in WORDLIST
+
+def test_uct_rave_and_grave_return_legal_moves():
+    state = WordleState("crane")
+    assert uct_rave_search(state, WORDLIST, n_iter=20) in WORDLIST
+    assert uct_grave_search(state, WORDLIST, n_iter=20, leaf_playouts=3) in WORDLIST
+
+def test_uct_reports_root_statistics():
+    info = {}
+    uct_search(WordleState("crane"), WORDLIST, n_iter=20, leaf_playouts=2, info=info)
+    assert set(info["root"]) == set(WORDLIST)
+    # The root is expanded on the first iteration; every later one visits a child
+    assert sum(n for n, _ in info["root"].values()) == 2 * 19
+
+def test_root_parallel_search():
+    state = WordleState("crane")
+    move = root_parallel_search(state, WORDLIST, search=uct_grave_search, n_workers=2, n_iter=10)
+    assert move in WORDLIST
+
+def test_root_parallel_pool_holds_the_wordlist():
+    root_parallel_search(WordleState("crane"), WORDLIST, n_workers=2, n_iter=5)
+    pool = solvers._POOL[2]
+    root_parallel_search(WordleState("stone"), WORDLIST, n_workers=2, n_iter=5)
+    assert solvers._POOL[2] is pool
+    other = list(WORDLIST)
+    assert root_parallel_search(WordleState("stone"), other, n_workers=2, n_iter=5) in other
+    assert solvers._POOL[1] is other and solvers._POOL[2] is not pool
+    solvers._shutdown_pool()
+    assert solvers._POOL is None
+
+@pytest.mark.parametrize("solver", [flat_mc, uct_search, uct_rave_search, uct_grave_search, nested_mc_search])
+def test_time_budget_reports_iterations(solver):
+    info = {}
+    limit = {"n_playouts": None} if solver is flat_mc else {} if solver is nested_mc_search else {"n_iter": None}
+    move = solver(WordleState("crane"), WORDLIST, time_budget_ms=20, info=info, **limit)
+    assert move in WORDLIST
+    assert info["iterations"] >= 1
+
+@pytest.mark.parametrize("solver", [flat_mc, uct_search, uct_grave_search])
+def test_unbounded_search_is_rejected(solver):
+    limit = {"n_playouts": None} if solver is flat_mc else {"n_iter": None}
+    with pytest.raises(ValueError):
+        solver(WordleState("crane"), WORDLIST, **limit)
+
+def test_flat_mc_builds_children_lazily(monkeypatch):
+    # With a tiny budget, the search stops long before every child is built
+    wordlist = [a + b + "ake" for a in "bcdfhjlmrstw" for b in "aeiou"]
+    built = []
+    play_into = WordleState.play_into
+    monkeypatch.setattr(WordleState, "play_into",
+                        lambda self, guess, out: built.append(guess) or play_into(self, guess, out))
+    info = {}
+    move = flat_mc(WordleState(wordlist[0]), wordlist, n_playouts=None, time_budget_ms=0.001, info=info)
+    assert move in wordlist
+    assert info["iterations"] >= 1
+    assert len(built) < len(wordlist)
+
+def test_uct_search_object_reuses_subtree():
+    solver = UCTSearch(uct_rave_search, n_iter=30)
+    state = WordleState("crane")
+    solver(state, WORDLIST)
+    state.play("stone")
+    info = {}
+    move = solver(state, WORDLIST, info=info)
+    assert move in state.legal_moves(WORDLIST)
+    assert info["reused_visits"] > 0
+    # A new game starts from an empty tree
+    info = {}
+    solver(WordleState("party"), WORDLIST, info=info)
+    assert info["reused_visits"] == 0
+
+def test_uct_search_object_has_stable_key():
+    solver = UCTSearch(uct_rave_search, n_iter=30, playout_fn=random_playout)
+    assert solver_key(solver) == "UCTSearch(uct_rave_search(n_iter=30, playout_fn=random_playout))"
+
+@pytest.mark.parametrize("eviction", ["visits", "lru"])
+def test_bounded_tree_evicts_nodes(eviction):
+    info = {}
+    tree = SearchTree(max_nodes=3, eviction=eviction)
+    move = uct_grave_search(WordleState("crane"), WORDLIST, n_iter=200, tree=tree, info=info)
+    assert move in WORDLIST
+    assert info["nodes"] <= 3
+    assert info["evicted"] > 0
+
+def test_flat_mc_batched_playouts():
+    info = {}
+    move = flat_mc(WordleState("crane"), WORDLIST, n_playouts=10, batch_size=4, info=info)
+    assert move in WORDLIST
+    assert info["iterations"] == 10 * len(WORDLIST)
+
+@pytest.mark.parametrize("prior", ["entropy", "frequency"])
+def test_progressive_widening_limits_root_children(prior):
+    info = {}
+    uct_rave_search(WordleState("crane"), WORDLIST, n_iter=4, prior=prior, info=info)
+    visited = [a for a, (n, _) in info["root"].items() if n > 0]
+    # 3 visits at the root: width ceil(sqrt(1)), ceil(sqrt(2)), ceil(sqrt(3)) -> at most 2 moves
+    assert 1 <= len(visited) <= 2
+
+def test_lru_eviction_keeps_new_nodes():
+    tree = SearchTree(max_nodes=3, eviction="lru")
+    state = WordleState("crane")
+    state.legal_moves(WORDLIST)
+    root_id = tree.add(state.key(), state, WORDLIST)
+    ids = {}
+    for move in ["spill", "stone"]:
+        tree.tick += 1
+        child = state.clone()
+        child.play(move)
+        ids[move] = tree.add(child.key(), child, WORDLIST)
+        tree.nodes[root_id].children[tree.nodes[root_id].moves.index(move)] = ids[move]
+        if move == "spill":
+            # selected once more before "stone" is expanded
+            tree.tick += 1
+            tree.nodes[ids[move]].stamp = tree.tick
+    tree.tick += 1
+    newest = state.clone()
+    newest.play("stone")
+    tree.evict(state.key())
+    assert tree.get(newest.key()) is not None
+    assert len(tree) == 2
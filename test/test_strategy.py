@@ -0,0 +1,37 @@
+from functools import partial
+
+from experiments import play_game
+from solvers import random_solver, uct_search
+from strategy import StrategyPlayer, build_strategy, export_strategy
+from wordle import WordleState
+
+WORDLIST = ["crane", "trace", "stone", "spill", "party", "apple", "grape", "melon"]
+
+
+def first_candidate(state, wordlist):
+    return state.legal_moves(wordlist)[0]
+
+
+def test_strategy_replays_solver_decisions():
+    player = StrategyPlayer(build_strategy(first_candidate, WORDLIST))
+    for secret in WORDLIST:
+        expected = play_game(secret, first_candidate, WORDLIST)
+        played = play_game(secret, player, WORDLIST)
+        assert played.history == expected.history
+
+
+def test_distribution_covers_every_secret():
+    player = StrategyPlayer(build_strategy(random_solver, WORDLIST, seed=3))
+    assert sum(player.distribution().values()) == len(WORDLIST)
+
+
+def test_export_and_load(tmp_path):
+    path = str(tmp_path / "strategy.json")
+    solver = partial(uct_search, n_iter=10)
+    export_strategy(solver, WORDLIST, path, n_workers=2)
+    player = StrategyPlayer.load(path, WORDLIST)
+    state = WordleState("melon")
+    guess = player(state)
+    state.play(guess)
+    assert player.next_guess(state.attempts) == player(state)
+    assert player.next_guess([("zzzzz", "BBBBB")]) is None
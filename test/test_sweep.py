@@ -0,0 +1,61 @@
+import pytest
+
+from playouts import entropy_plus_playout
+from results_store import ResultStore
+from sweep import format_table, grid, make_solver, sample_space, successive_halving
+
+WORDLIST = ["crane", "trace", "stone", "spill", "party", "apple", "grape", "melon", "lemon"]
+
+
+def pick(state, wordlist, index=0, give_up=False):
+    if give_up and state.history:
+        return None
+    moves = state.legal_moves(wordlist)
+    return moves[min(index, len(moves) - 1)]
+
+
+def test_grid_and_random_spaces():
+    space = {"c": [0.5, 1.0, 2.0], "rave_k": [100, 300]}
+    assert len(grid(space)) == 6
+    configs = sample_space({"c": [1.0], "n_iter": lambda rng: rng.choice([10, 20])}, n=20)
+    assert 1 <= len(configs) <= 2
+    assert all(config["c"] == 1.0 for config in configs)
+
+
+def test_make_solver_binds_nested_arguments():
+    solver = make_solver(pick, {"index": 2, "playout_fn": entropy_plus_playout, "playout_fn.alpha": 0.3})
+    assert solver.keywords["index"] == 2
+    assert solver.keywords["playout_fn"].func is entropy_plus_playout
+    assert solver.keywords["playout_fn"].keywords == {"alpha": 0.3}
+
+
+def test_make_solver_rejects_nested_argument_without_its_function():
+    with pytest.raises(ValueError, match="'playout_fn'"):
+        make_solver(pick, {"playout_fn.alpha": 0.3})
+
+
+def test_successive_halving_prunes_and_caches(tmp_path):
+    path = str(tmp_path / "sweep.jsonl")
+    configs = grid({"index": [0, 1, 2], "give_up": [False, True]})
+    rows = successive_halving(pick, configs, WORDLIST, min_games=3, eta=3, store=path, verbose=False)
+
+    assert len(rows) == 6
+    # 6 configs x 3 games, then the best 6 // 3 = 2 on all 9 secrets
+    assert [r["games"] for r in rows] == [9, 9, 3, 3, 3, 3]
+    assert rows[0]["rung"] == 1 and rows[0]["params"]["give_up"] is False
+    assert all(r["cpu_s_per_game"] >= 0 for r in rows)
+    assert "cost" in format_table(rows)
+
+    played = len(list(ResultStore(path)))
+    assert played == 6 * 3 + 2 * 6
+    again = successive_halving(pick, configs, WORDLIST, min_games=3, eta=3, store=path, verbose=False)
+    assert len(list(ResultStore(path))) == played
+    assert [r["config"] for r in again] == [r["config"] for r in rows]
+
+
+def test_parallel_sweep_matches_serial():
+    configs = grid({"index": [0, 3]})
+    serial = successive_halving(pick, configs, WORDLIST, min_games=4, eta=2, verbose=False)
+    parallel = successive_halving(pick, configs, WORDLIST, min_games=4, eta=2, n_workers=2,
+                                  verbose=False)
+    assert [(r["config"], r["mean_cost"]) for r in serial] == [(r["config"], r["mean_cost"]) for r in parallel]
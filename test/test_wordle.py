@@ -1,5 +1,5 @@
 import pytest
-from wordle import WordleState
+from wordle import WordleState, parse_history, state_from_history
 from playouts import (
     random_playout,
     entropy_playout,
@@ -42,3 +42,24 @@ def test_entropy_plus_playout(state, wordlist):
 def test_frequency_plus_playout(state, wordlist):
     result = frequency_plus_playout(state, wordlist)
     assert result in [0.0, 1.0]
+
+
+def test_parse_history_accepts_strings_and_codes():
+    assert parse_history([["crane", "bbbbb"], ("stone", 242)]) == (("crane", 0), ("stone", 242))
+    with pytest.raises(ValueError):
+        parse_history([["crane", "BBXBB"]])
+    for guess in ("cranes", "cr4ne", "crâne", 12345):
+        with pytest.raises(ValueError):
+            parse_history([[guess, "BBBBB"]])
+
+
+def test_state_from_history_draws_a_consistent_secret(wordlist):
+    history = parse_history([["grape", WordleState("apple").feedback("grape")]])
+    state = state_from_history(wordlist, history, seed=1)
+    assert state.history == history
+    assert state.secret in state.legal_moves(wordlist)
+    assert "grape" not in state.legal_moves(wordlist)
+    with pytest.raises(ValueError):
+        state_from_history(wordlist, parse_history([["apple", "GGGGG"]]))
+    with pytest.raises(ValueError):
+        state_from_history(wordlist, parse_history([["apple", "BBBBB"], ["melon", "BBBBB"]]))
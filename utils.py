@@ -1,9 +1,15 @@
 import os
-import os
 import random
+from functools import partial
+import numpy as np
+from feedback import DEFAULT_CACHE_DIR, WordList
 
-def load_wordlist(path="wordlist.txt", limit=None):
-    
+def load_wordlist(path="wordlist.txt", limit=None, cache_dir=DEFAULT_CACHE_DIR):
+    """
+    Load the 5-letter words of 'path' as a WordList.
+    Its feedback table is memory-mapped from 'cache_dir' on first use
+    (rebuilt only when the list changes); cache_dir=None keeps it in memory.
+    """
     if not os.path.exists(path):
         raise FileNotFoundError(f"Wordlist not found: {path}")
 
@@ -16,7 +22,38 @@ def load_wordlist(path="wordlist.txt", limit=None):
     if limit is not None:
         words = random.sample(words, min(limit, len(words)))
 
-    return words
+    return WordList(words, cache_dir=cache_dir)
+
+
+def derive_seed(seed, *keys):
+    """Seed derived from a master seed and integer keys (independent of scheduling)."""
+    return int(np.random.SeedSequence([seed, *keys]).generate_state(1)[0])
+
+
+def seed_all(seed):
+    """Seed the global RNGs used by solvers and playouts."""
+    random.seed(seed)
+    np.random.seed(seed % 2 ** 32)
+
+
+def _describe(value):
+    if isinstance(value, partial):
+        return solver_key(value)
+    return getattr(value, "__qualname__", None) or repr(value)
+
+
+def solver_key(solver):
+    """
+    Stable description of a solver configuration, e.g.
+    "uct_search(n_iter=100, playout_fn=random_playout)".
+    Lambdas and closures have no stable identity: use functools.partial
+    (or give callable objects a __repr__).
+    """
+    if isinstance(solver, partial):
+        args = [_describe(a) for a in solver.args]
+        args += [f"{k}={_describe(v)}" for k, v in sorted(solver.keywords.items())]
+        return f"{_describe(solver.func)}({', '.join(args)})"
+    return _describe(solver)
 
 
 def save_results(stats, path="results.txt"):
@@ -1,22 +1,44 @@
-import copy
+import random
+
+from feedback import ALL_GREEN, PATTERNS, encode_pattern, pattern_code, table_for
 
 class WordleState:
     """
     Classe représentant l'état d'une partie de Wordle.
     - secret : le mot à deviner
-    - attempts : liste des (guess, feedback)
+    - history : tuple immuable des (guess, code du feedback)
+    - attempts : liste des (guess, feedback) reconstruite depuis history
     - max_attempts : nombre maximum de coups (6 par défaut)
+    - table : FeedbackTable optionnelle (liée au premier appel de legal_moves)
+    - candidates : indices (dans la table) des mots encore cohérents,
+      réduits incrémentalement à chaque play() une fois la table liée
+
+    history, candidates et la liste des coups ne sont jamais modifiés en
+    place : clone() les partage simplement entre états.
     """
 
-    def __init__(self, secret, max_attempts=6):
+    __slots__ = ("secret", "max_attempts", "history", "table",
+                 "candidates", "_wordlist", "_moves")
+
+    def __init__(self, secret, max_attempts=6, table=None):
         self.secret = secret
-        self.attempts = []
         self.max_attempts = max_attempts
+        self.history = ()
+        self.table = table
+        self.candidates = None
+        self._wordlist = None
+        self._moves = None
+
+    @property
+    def attempts(self):
+        """Historique décodé : liste des (guess, feedback 'G'/'Y'/'B')."""
+        return [(guess, PATTERNS[code]) for guess, code in self.history]
 
     def is_terminal(self):
         """Retourne True si la partie est finie (trouvé ou max tentatives)."""
-        return (len(self.attempts) >= self.max_attempts
-                or (self.attempts and self.attempts[-1][0] == self.secret))
+        history = self.history
+        return (len(history) >= self.max_attempts
+                or (bool(history) and history[-1][0] == self.secret))
 
     def feedback(self, guess):
         """
@@ -26,53 +48,81 @@ class WordleState:
         - 'Y' (Yellow): lettre présente mais mal placée
         - 'B' (Black) : lettre absente
         """
-        result = []
-        for i, c in enumerate(guess):
-            if c == self.secret[i]:
-                result.append("G")
-            elif c in self.secret:
-                result.append("Y")
-            else:
-                result.append("B")
-        return "".join(result)
+        return PATTERNS[self.feedback_code(self.secret, guess)]
 
     def feedback_sim(self, candidate, guess):
         """
         Simule le feedback si le mot secret était 'candidate'.
         Utile pour filtrer les mots cohérents.
+        Lecture dans la matrice précalculée si la table est liée.
         """
-        result = []
-        for i, c in enumerate(guess):
-            if c == candidate[i]:
-                result.append("G")
-            elif c in candidate:
-                result.append("Y")
-            else:
-                result.append("B")
-        return "".join(result)
+        return PATTERNS[self.feedback_code(candidate, guess)]
+
+    def feedback_code(self, candidate, guess):
+        """Comme feedback_sim, mais renvoie le code entier (0..242)."""
+        if self.table is not None:
+            return self.table.code(guess, candidate)
+        return pattern_code(candidate, guess)
 
     def legal_moves(self, wordlist):
         """
         Retourne la liste des coups (mots) encore légaux,
         c'est-à-dire cohérents avec tous les feedbacks passés.
+        L'ensemble des candidats est maintenu par play() : une fois lié à
+        'wordlist', l'appel ne fait que renvoyer la liste en cache
+        (à ne pas modifier par l'appelant).
         """
-        candidates = []
-        for w in wordlist:
-            ok = True
-            for past_guess, past_fb in self.attempts:
-                if self.feedback_sim(w, past_guess) != past_fb:
-                    ok = False
-                    break
-            if ok:
-                candidates.append(w)
-        return candidates
+        if wordlist is not self._wordlist:
+            self.bind(wordlist)
+        if self._moves is None:
+            self._moves = [self._wordlist[i] for i in self.candidates]
+        return self._moves
+
+    def bind(self, wordlist):
+        """
+        Lie l'état à 'wordlist' : récupère sa table et filtre une fois
+        tous les mots contre l'historique.
+        """
+        table = table_for(wordlist)
+        candidates = table.all_indices()
+        for past_guess, past_code in self.history:
+            candidates = table.filter(candidates, past_guess, past_code)
+        self.table = table
+        self.candidates = candidates
+        self._wordlist = wordlist
+        self._moves = None
 
     def play(self, guess):
         """
         Joue un mot, calcule et enregistre son feedback.
+        Si l'état est lié, ne filtre que les candidats restants.
+        """
+        code = self.feedback_code(self.secret, guess)
+        self.history = self.history + ((guess, code),)
+        if self.candidates is not None:
+            self.candidates = self.table.filter(self.candidates, guess, code)
+            self._moves = None
+
+    def play_into(self, guess, out):
+        """
+        Écrit dans 'out' l'état obtenu en jouant 'guess' depuis self,
+        sans créer de nouvel objet (état « brouillon » des playouts).
+        """
+        self.copy_to(out)
+        out.play(guess)
+        return out
+
+    def key(self):
         """
-        fb = self.feedback(guess)
-        self.attempts.append((guess, fb))
+        Clé canonique de l'état pour les tables de transposition :
+        (nombre de coups, gagné, candidats restants). Deux historiques qui
+        laissent les mêmes candidats au même coup partagent la même clé.
+        """
+        if self.candidates is None:
+            remaining = tuple(sorted(self.history))
+        else:
+            remaining = self.candidates.tobytes()
+        return (len(self.history), self.is_won(), remaining)
 
     def score(self):
         """
@@ -80,18 +130,83 @@ class WordleState:
         - 1.0 si gagné (le dernier guess == secret)
         - 0.0 sinon
         """
-        if self.attempts and self.attempts[-1][0] == self.secret:
-            return 1.0
-        return 0.0
-    
+        return 1.0 if self.is_won() else 0.0
+
     def is_won(self):
         """Retourne True si la partie est gagnée (dernier guess == secret)."""
-        return self.attempts and self.attempts[-1][0] == self.secret
+        return bool(self.history) and self.history[-1][0] == self.secret
+
+    def copy_to(self, out):
+        """Recopie (en partageant les structures immuables) self dans 'out'."""
+        out.secret = self.secret
+        out.max_attempts = self.max_attempts
+        out.history = self.history
+        out.table = self.table
+        out.candidates = self.candidates
+        out._wordlist = self._wordlist
+        out._moves = self._moves
+        return out
 
     def copy(self):
-        """Retourne une copie profonde de l'état (utile pour les simulations)."""
-        return copy.deepcopy(self)
+        """Retourne une copie de l'état en temps constant (utile pour les simulations).
+        Toutes les structures sont partagées : aucune n'est modifiée en place."""
+        return self.copy_to(WordleState.__new__(WordleState))
 
     def clone(self):
         """Alias de copy(), pour compatibilité avec MCTS."""
         return self.copy()
+
+    def __getstate__(self):
+        # La table et les candidats se reconstruisent au prochain legal_moves
+        return (self.secret, self.max_attempts, self.history)
+
+    def __setstate__(self, state):
+        self.secret, self.max_attempts, self.history = state
+        self.table = None
+        self.candidates = None
+        self._wordlist = None
+        self._moves = None
+
+
+def parse_history(history):
+    """
+    Historique fourni par un client -> tuple de (guess, code).
+    Les feedbacks sont des chaînes 'G'/'Y'/'B' ou des codes (0..242).
+    Lève ValueError si l'historique est mal formé.
+    """
+    parsed = []
+    for item in history:
+        if not isinstance(item, (list, tuple)) or len(item) != 2:
+            raise ValueError(f"history items must be [guess, feedback], got {item!r}")
+        guess, feedback = item
+        if not isinstance(guess, str) or len(guess) != 5 or not (guess.isascii() and guess.isalpha()):
+            raise ValueError(f"bad guess {guess!r} (5 letters a-z expected)")
+        if isinstance(feedback, str):
+            if len(feedback) != 5 or set(feedback.upper()) - set("GYB"):
+                raise ValueError(f"bad feedback {feedback!r}")
+            code = encode_pattern(feedback.upper())
+        else:
+            code = int(feedback)
+            if not 0 <= code <= ALL_GREEN:
+                raise ValueError(f"bad feedback code {feedback!r}")
+        parsed.append((guess.lower(), code))
+    return tuple(parsed)
+
+
+def state_from_history(wordlist, history, seed=0, max_attempts=6):
+    """
+    État lié à 'wordlist' atteint par 'history' (tuple de (guess, code)),
+    quand le secret est inconnu : il est tiré (selon 'seed') parmi les
+    candidats cohérents, car les solveurs jouent contre state.secret.
+    Lève ValueError si la partie est finie ou si aucun mot n'est cohérent.
+    """
+    if len(history) >= max_attempts or (history and history[-1][1] == ALL_GREEN):
+        raise ValueError("the game is already over")
+    state = WordleState(None, max_attempts=max_attempts)
+    state.history = tuple(history)
+    state.legal_moves(wordlist)
+    if len(state.candidates) == 0:
+        raise ValueError("no word of the list is consistent with this history")
+    pick = random.Random(seed).randrange(len(state.candidates))
+    state.secret = wordlist[int(state.candidates[pick])]
+    return state